@@ -33,6 +33,7 @@
           pytest-asyncio
           pytest-cov
           pytest-benchmark
+          pytest-xdist
           hypothesis
           mypy
           ruff
@@ -8,9 +8,41 @@ and structural requirements.
 """
 
 import re
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
+# Heading star prefixes and padding runs for common sizes; see _stars() and _spaces()
+_STARS = tuple("*" * n for n in range(16))
+_SPACES = tuple(" " * n for n in range(64))
+
+# Characters not allowed in tags
+_TAG_INVALID_CHARS = re.compile(r"[:\s]+")
+
+
+def _stars(level: int) -> str:
+    """Return the heading star prefix for level."""
+    return _STARS[level] if 0 <= level < len(_STARS) else "*" * level
+
+
+def _spaces(count: int) -> str:
+    """Return a run of count spaces."""
+    return _SPACES[count] if 0 <= count < len(_SPACES) else " " * count
+
+
+def _is_property_name(name: str) -> bool:
+    """
+    Check whether name matches [A-Za-z_][A-Za-z0-9_-]* (a property/drawer name).
+
+    Plain string tests instead of a regex; this runs for every content line
+    that starts with a colon.
+    """
+    return (
+        name.isascii()
+        and (name[:1].isalpha() or name[:1] == "_")
+        and name.replace("_", "a").replace("-", "a").isalnum()
+    )
+
 
 class OrgFormatter:
     """Format GitHub data as Org-mode entries."""
@@ -96,10 +128,10 @@ class OrgFormatter:
             elif stripped.startswith(":") and ":" in stripped[1:]:
                 # Check if it looks like a property or drawer
                 # Format: :WORD: or :WORD:WORD:
-                colon_pos = stripped.index(":", 1)
+                colon_pos = stripped.find(":", 1)
                 potential_keyword = stripped[1:colon_pos]
                 # If it's alphanumeric/underscore, it's likely a property
-                if potential_keyword and re.match(r"^[A-Za-z_][A-Za-z0-9_-]*$", potential_keyword):
+                if _is_property_name(potential_keyword):
                     needs_escape = True
 
             if needs_escape:
@@ -151,7 +183,7 @@ class OrgFormatter:
             if not tag:
                 continue
             # Replace spaces, colons, and other problematic characters
-            clean_tag = re.sub(r"[:\s]+", "_", tag.strip())
+            clean_tag = _TAG_INVALID_CHARS.sub("_", tag.strip())
             # Remove leading/trailing underscores
             clean_tag = clean_tag.strip("_")
             if clean_tag:
@@ -212,7 +244,7 @@ class OrgFormatter:
                 if prop_prefix_len >= target_column:
                     padding = " "
                 else:
-                    padding = " " * (target_column - prop_prefix_len)
+                    padding = _spaces(target_column - prop_prefix_len)
                 lines.append(f"{indent}:{key_upper}:{padding}{value_str}")
             else:
                 lines.append(f"{indent}:{key_upper}:")
@@ -268,7 +300,7 @@ class OrgFormatter:
         todo_state = "DONE" if state == "closed" else "TODO"
 
         # Format heading with tags
-        stars = "*" * level
+        stars = _stars(level)
         tag_string = self.format_tags(labels, include_link=self.add_link_tag)
         heading = f"{stars} {todo_state} {title} {tag_string}\n"
 
@@ -305,7 +337,7 @@ class OrgFormatter:
         comments_text = ""
         if comments:
             comment_level = level + 1
-            comment_stars = "*" * comment_level
+            comment_stars = _stars(comment_level)
             for comment in comments:
                 comment_author = comment.get("author", "unknown")
                 comment_created = comment.get("created_at")
@@ -361,6 +393,19 @@ class OrgFormatter:
             level=level,
         )
 
+    def format_issues(self, issues: Iterable[dict[str, Any]], level: int = 1) -> str:
+        """
+        Format several issues as consecutive Org-mode entries.
+
+        Args:
+            issues: Issue dictionaries, as accepted by format_issue_from_dict
+            level: Heading level for every issue
+
+        Returns:
+            The formatted entries, separated by blank lines
+        """
+        return "\n".join(self.format_issue_from_dict(issue, level) for issue in issues)
+
 
 def format_org_file_header(
     title: str, description: str = "", author: str = "", startup_options: list[str] | None = None
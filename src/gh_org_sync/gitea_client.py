@@ -7,6 +7,7 @@ including fetching issues, comments, and handling authentication.
 
 import logging
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 import httpx
@@ -163,14 +164,14 @@ class GiteaClient(IssueProvider):
         if data is None:
             return User(login="unknown")
         return User(
-            login=data.get("login") or data.get("username", "unknown"),
+            login=data.get("login") or data.get("username") or "unknown",
             url=data.get("html_url") or data.get("avatar_url"),
         )
 
     def _parse_label(self, data: dict[str, Any]) -> Label:
         """Parse label data from Gitea API response."""
         return Label(
-            name=data.get("name", ""),
+            name=data.get("name") or "",
             color=data.get("color"),
             description=data.get("description"),
         )
@@ -180,9 +181,9 @@ class GiteaClient(IssueProvider):
         if not data:
             return None
         return Milestone(
-            title=data.get("title", ""),
-            number=data.get("id", 0),
-            state=data.get("state", "open"),
+            title=data.get("title") or "",
+            number=int(data.get("id") or 0),
+            state=data.get("state") or "open",
             due_on=self._parse_datetime(data.get("due_on")),
         )
 
@@ -191,9 +192,7 @@ class GiteaClient(IssueProvider):
         if not value:
             return None
         try:
-            # Gitea uses ISO 8601 format
-            if value.endswith("Z"):
-                value = value[:-1] + "+00:00"
+            # Python 3.11+ accepts the "Z" suffix directly
             return datetime.fromisoformat(value)
         except (ValueError, TypeError):
             logger.warning(f"Failed to parse datetime: {value}")
@@ -202,9 +201,9 @@ class GiteaClient(IssueProvider):
     def _parse_comment(self, data: dict[str, Any]) -> Comment:
         """Parse comment data from Gitea API response."""
         return Comment(
-            id=data.get("id", 0),
+            id=data.get("id") or 0,
             author=self._parse_user(data.get("user")),
-            body=data.get("body", ""),
+            body=data.get("body") or "",
             created_at=self._parse_datetime(data.get("created_at")) or datetime.now(UTC),
             updated_at=self._parse_datetime(data.get("updated_at")),
             url=data.get("html_url"),
@@ -243,7 +242,7 @@ class GiteaClient(IssueProvider):
             labels=labels,
             milestone=milestone,
             url=data.get("html_url", ""),
-            comments=sorted(issue_comments, key=lambda c: c.created_at),
+            comments=issue_comments,
         )
 
     async def _fetch_comments(self, repo: str, issue_number: int) -> list[Comment]:
@@ -338,7 +337,7 @@ class GiteaClient(IssueProvider):
             page += 1
 
         # Sort by issue number
-        all_issues.sort(key=lambda i: i.number)
+        all_issues.sort(key=attrgetter("number"))
 
         logger.info(f"Fetched {len(all_issues)} issues from Gitea")
         return all_issues[:limit] if limit else all_issues
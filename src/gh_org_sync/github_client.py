@@ -10,6 +10,7 @@ import json
 import logging
 import shutil
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 from .exceptions import (
@@ -203,7 +204,7 @@ class GitHubClient(IssueProvider):
         if isinstance(data, str):
             return User(login=data)
         return User(
-            login=data.get("login", "unknown"),
+            login=data.get("login") or "unknown",
             url=data.get("url"),
         )
 
@@ -212,7 +213,7 @@ class GitHubClient(IssueProvider):
         if isinstance(data, str):
             return Label(name=data)
         return Label(
-            name=data.get("name", ""),
+            name=data.get("name") or "",
             color=data.get("color"),
             description=data.get("description"),
         )
@@ -222,9 +223,9 @@ class GitHubClient(IssueProvider):
         if not data:
             return None
         return Milestone(
-            title=data.get("title", ""),
-            number=data.get("number", 0),
-            state=data.get("state", "open"),
+            title=data.get("title") or "",
+            number=int(data.get("number") or 0),
+            state=data.get("state") or "open",
             due_on=self._parse_datetime(data.get("dueOn")),
         )
 
@@ -233,9 +234,7 @@ class GitHubClient(IssueProvider):
         if not value:
             return None
         try:
-            # Handle both Z suffix and +00:00 format
-            if value.endswith("Z"):
-                value = value[:-1] + "+00:00"
+            # Python 3.11+ accepts the "Z" suffix directly
             return datetime.fromisoformat(value)
         except (ValueError, TypeError):
             logger.warning(f"Failed to parse datetime: {value}")
@@ -244,9 +243,9 @@ class GitHubClient(IssueProvider):
     def _parse_comment(self, data: dict[str, Any]) -> Comment:
         """Parse comment data."""
         return Comment(
-            id=data.get("id", 0),
+            id=data.get("id") or 0,
             author=self._parse_user(data.get("author")),
-            body=data.get("body", ""),
+            body=data.get("body") or "",
             created_at=self._parse_datetime(data.get("createdAt")) or datetime.now(UTC),
             updated_at=self._parse_datetime(data.get("updatedAt")),
             url=data.get("url"),
@@ -285,7 +284,7 @@ class GitHubClient(IssueProvider):
             labels=labels,
             milestone=milestone,
             url=data.get("url", ""),
-            comments=sorted(comments, key=lambda c: c.created_at),
+            comments=comments,
         )
 
     async def fetch_issues(
@@ -368,7 +367,7 @@ class GitHubClient(IssueProvider):
         issues = [self._parse_issue(data) for data in issues_data]
 
         # Sort by issue number
-        issues.sort(key=lambda i: i.number)
+        issues.sort(key=attrgetter("number"))
 
         logger.info(f"Fetched {len(issues)} issues")
         return issues
@@ -10,6 +10,7 @@ This module provides the core merge algorithm that:
 
 import logging
 import re
+from operator import attrgetter
 
 from .models import (
     GitHubIssue,
@@ -20,12 +21,35 @@ from .models import (
 )
 from .org_writer import (
     OrgWriter,
+    clean_tag,
     escape_org_content,
     format_timestamp,
 )
 
 logger = logging.getLogger(__name__)
 
+# Non-GITHUB_* property names that are owned by the sync and rewritten on merge
+_GITHUB_MANAGED_KEYS = frozenset(("URL", "CREATED", "AUTHOR", "ASSIGNEES", "MILESTONE", "CLOSED"))
+
+
+def _issue_properties(issue: GitHubIssue) -> dict[str, str]:
+    """Build the GitHub-managed properties for an issue heading."""
+    properties = {
+        "GITHUB_NUMBER": str(issue.number),
+        "URL": str(issue.url),
+        "GITHUB_STATE": issue.state.value,
+        "GITHUB_UPDATED": format_timestamp(issue.updated_at),
+        "CREATED": format_timestamp(issue.created_at),
+        "AUTHOR": issue.author.login,
+    }
+    if issue.assignee_logins:
+        properties["ASSIGNEES"] = ", ".join(issue.assignee_logins)
+    if issue.milestone:
+        properties["MILESTONE"] = issue.milestone.title
+    if issue.closed_at:
+        properties["CLOSED"] = format_timestamp(issue.closed_at)
+    return properties
+
 
 def _normalize_for_comparison(text: str) -> str:
     """
@@ -105,8 +129,11 @@ class OrgMerger:
             total_org_headings=len(existing_headings),
         )
 
-        # Build index of GitHub issues by number for efficient lookup
-        issue_index: dict[int, GitHubIssue] = {issue.number: issue for issue in github_issues}
+        # Build index of GitHub issues by number for efficient lookup (nothing
+        # to look up when the file is new or empty)
+        issue_index: dict[int, GitHubIssue] = (
+            {issue.number: issue for issue in github_issues} if existing_headings else {}
+        )
 
         # Track which GitHub issues have been processed
         processed_issue_numbers: set[int] = set()
@@ -120,7 +147,7 @@ class OrgMerger:
             if gh_num is None:
                 # User-created heading with no GitHub link - preserve as-is
                 merged_headings.append(heading)
-                result.preserved += 1
+                result.count(MergeAction.PRESERVED)
             elif gh_num in issue_index:
                 # Existing heading with matching GitHub issue - merge in place
                 issue = issue_index[gh_num]
@@ -141,14 +168,16 @@ class OrgMerger:
                 # Existing heading with GITHUB_NUMBER but no matching issue
                 # (might be closed/deleted issue) - preserve as-is
                 merged_headings.append(heading)
-                result.preserved += 1
+                result.count(MergeAction.PRESERVED)
 
         # Append new issues that weren't in the existing file
         # Sort new issues by number for consistent ordering of additions
-        new_issues = [
-            issue for issue in github_issues if issue.number not in processed_issue_numbers
-        ]
-        for issue in sorted(new_issues, key=lambda i: i.number):
+        new_issues = (
+            [issue for issue in github_issues if issue.number not in processed_issue_numbers]
+            if processed_issue_numbers
+            else github_issues
+        )
+        for issue in sorted(new_issues, key=attrgetter("number")):
             new_heading = self._issue_to_heading(issue)
             merged_headings.append(new_heading)
             result.add_entry(
@@ -231,26 +260,26 @@ class OrgMerger:
 
         GitHub labels become tags, but user-added tags are preserved.
         """
+        # Tags collect as dict keys: insertion-ordered with O(1) de-duplication
+        label_tags = [clean_tag(label) for label in issue.label_names]
+
         # Start with LINK tag if enabled
-        tags: list[str] = []
-        if self.add_link_tag:
-            tags.append("LINK")
+        tags: dict[str, None] = {"LINK": None} if self.add_link_tag else {}
 
         # Add GitHub labels as tags
-        for label in issue.label_names:
-            clean_tag = re.sub(r"[:\s]+", "_", label.strip()).strip("_")
-            if clean_tag and clean_tag not in tags:
-                tags.append(clean_tag)
+        tags.update(dict.fromkeys(tag for tag in label_tags if tag))
 
         # Preserve user-added tags (not from GitHub labels and not LINK)
-        github_label_tags = {
-            re.sub(r"[:\s]+", "_", lbl.strip()).strip("_") for lbl in issue.label_names
-        }
-        for tag in existing.tags:
-            if tag.upper() != "LINK" and tag not in github_label_tags and tag not in tags:
-                tags.append(tag)
+        github_label_tags = set(label_tags)
+        tags.update(
+            dict.fromkeys(
+                tag
+                for tag in existing.tags
+                if tag.upper() != "LINK" and tag not in github_label_tags
+            )
+        )
 
-        return tags
+        return list(tags)
 
     def _merge_properties(
         self,
@@ -262,29 +291,12 @@ class OrgMerger:
 
         GitHub properties are updated, user properties preserved.
         """
-        # Start with user properties (non-GITHUB_* prefix)
-        github_managed = ("URL", "CREATED", "AUTHOR", "ASSIGNEES", "MILESTONE", "CLOSED")
-        properties: dict[str, str] = {}
-        for key, value in existing.properties.items():
-            if not key.startswith("GITHUB_") and key not in github_managed:
-                properties[key] = value
-
-        # Add/update GitHub properties
-        properties["GITHUB_NUMBER"] = str(issue.number)
-        properties["URL"] = str(issue.url)
-        properties["GITHUB_STATE"] = issue.state.value
-        properties["GITHUB_UPDATED"] = format_timestamp(issue.updated_at)
-        properties["CREATED"] = format_timestamp(issue.created_at)
-        properties["AUTHOR"] = issue.author.login
-
-        if issue.assignee_logins:
-            properties["ASSIGNEES"] = ", ".join(issue.assignee_logins)
-        if issue.milestone:
-            properties["MILESTONE"] = issue.milestone.title
-        if issue.closed_at:
-            properties["CLOSED"] = format_timestamp(issue.closed_at)
-
-        return properties
+        # Start with user properties (non-GITHUB_* prefix), then overlay GitHub ones
+        return {
+            key: value
+            for key, value in existing.properties.items()
+            if not key.startswith("GITHUB_") and key not in _GITHUB_MANAGED_KEYS
+        } | _issue_properties(issue)
 
     def _merge_content(
         self,
@@ -313,17 +325,14 @@ class OrgMerger:
 
     def _extract_user_content(self, content: str) -> str:
         """Extract user-added content after the sync marker."""
-        if self.SYNC_MARKER not in content:
+        # Single scan: partition finds the marker and splits on it at once
+        _, marker, user_content = content.partition(self.SYNC_MARKER)
+        if not marker:
             # No marker, check if there's content that looks user-added
             # For legacy entries, we can't distinguish, so preserve nothing
             return ""
 
-        # Split on marker and take content after it
-        parts = content.split(self.SYNC_MARKER, 1)
-        if len(parts) > 1:
-            return parts[1].strip()
-
-        return ""
+        return user_content.strip()
 
     def _merge_children(
         self,
@@ -339,7 +348,7 @@ class OrgMerger:
 
         # Build comment children from GitHub
         if issue.comments:
-            for comment in sorted(issue.comments, key=lambda c: c.created_at):
+            for comment in issue.comments:
                 timestamp = format_timestamp(comment.created_at)
                 author = comment.author.login
                 comment_content = ""
@@ -367,26 +376,9 @@ class OrgMerger:
         if self.add_link_tag:
             tags.append("LINK")
         for label in issue.label_names:
-            clean_tag = re.sub(r"[:\s]+", "_", label.strip()).strip("_")
-            if clean_tag:
-                tags.append(clean_tag)
-
-        # Build properties
-        properties: dict[str, str] = {
-            "GITHUB_NUMBER": str(issue.number),
-            "URL": str(issue.url),
-            "GITHUB_STATE": issue.state.value,
-            "GITHUB_UPDATED": format_timestamp(issue.updated_at),
-            "CREATED": format_timestamp(issue.created_at),
-            "AUTHOR": issue.author.login,
-        }
-
-        if issue.assignee_logins:
-            properties["ASSIGNEES"] = ", ".join(issue.assignee_logins)
-        if issue.milestone:
-            properties["MILESTONE"] = issue.milestone.title
-        if issue.closed_at:
-            properties["CLOSED"] = format_timestamp(issue.closed_at)
+            cleaned = clean_tag(label)
+            if cleaned:
+                tags.append(cleaned)
 
         # Build content (body only - comments are children)
         content = ""
@@ -396,7 +388,7 @@ class OrgMerger:
         # Build comment children
         children: list[OrgHeading] = []
         if issue.comments:
-            for comment in sorted(issue.comments, key=lambda c: c.created_at):
+            for comment in issue.comments:
                 timestamp = format_timestamp(comment.created_at)
                 author = comment.author.login
                 comment_content = ""
@@ -415,7 +407,7 @@ class OrgMerger:
             title=issue.title,
             todo_state=OrgTodoState.DONE if issue.state.value == "closed" else OrgTodoState.TODO,
             tags=tags,
-            properties=properties,
+            properties=_issue_properties(issue),
             content=content,
             children=children,
         )
@@ -1,14 +1,22 @@
 """
-Pydantic models for GitHub issues and Org-mode structures.
-
-This module defines the data models used throughout the application,
-providing strong typing, validation, and serialization capabilities.
+Data models for GitHub issues and Org-mode structures.
+
+This module defines the data models used throughout the application.
+Issues received from providers are Pydantic models for validation and
+serialization. The small value objects nested inside them (users, labels,
+milestones, comments), merge records and parsed Org-mode structures are
+lightweight dataclasses, since they are created in bulk from already-typed
+values. Pydantic checks nested dicts when an issue is built from raw data, but
+passes dataclass instances through as-is, so the provider clients coerce
+missing or null API fields before constructing them.
 """
 
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class IssueState(StrEnum):
@@ -18,47 +26,43 @@ class IssueState(StrEnum):
     CLOSED = "closed"
 
 
-class User(BaseModel):
+@dataclass(frozen=True, slots=True)
+class User:
     """GitHub user representation."""
 
-    model_config = ConfigDict(frozen=True)
-
     login: str
-    url: HttpUrl | None = None
+    url: str | None = None  # Provider-supplied; not re-validated per user
 
 
-class Label(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Label:
     """GitHub issue label."""
 
-    model_config = ConfigDict(frozen=True)
-
     name: str
     color: str | None = None
     description: str | None = None
 
 
-class Milestone(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Milestone:
     """GitHub milestone."""
 
-    model_config = ConfigDict(frozen=True)
-
     title: str
     number: int
     state: str = "open"
     due_on: datetime | None = None
 
 
-class Comment(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Comment:
     """GitHub issue comment."""
 
-    model_config = ConfigDict(frozen=True)
-
     id: int | str  # GitHub returns GraphQL node IDs as strings
     author: User
     body: str
     created_at: datetime
     updated_at: datetime | None = None
-    url: HttpUrl | None = None
+    url: str | None = None  # Provider-supplied; not re-validated per comment
 
 
 class GitHubIssue(BaseModel):
@@ -86,6 +90,12 @@ class GitHubIssue(BaseModel):
     url: HttpUrl
     comments: list[Comment] = Field(default_factory=list)
 
+    @field_validator("comments")
+    @classmethod
+    def _sort_comments(cls, comments: list[Comment]) -> list[Comment]:
+        """Store comments in chronological order so consumers never re-sort."""
+        return sorted(comments, key=lambda c: c.created_at)
+
     @property
     def label_names(self) -> list[str]:
         """Get list of label names."""
@@ -97,6 +107,44 @@ class GitHubIssue(BaseModel):
         return [a.login for a in self.assignees]
 
 
+# Org-mode timestamp as written by format_timestamp: [2024-11-01 Fri 16:12]
+_ORG_TIMESTAMP_PATTERN = re.compile(r"[\[<](\d{4}-\d{2}-\d{2})\s+\w+\s+(\d{2}:\d{2})[\]>]")
+
+
+def _parse_github_number(num_str: str | None) -> int | None:
+    """Parse a GITHUB_NUMBER property value."""
+    if num_str:
+        try:
+            return int(num_str)
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_github_updated(updated_str: str | None) -> datetime | None:
+    """Parse a GITHUB_UPDATED property value (ISO or Org-mode timestamp)."""
+    if not updated_str:
+        return None
+
+    # Org-mode format, as the writer emits it: [2024-11-01 Fri 16:12]. Checking
+    # the bracket first avoids a failed (and raising) ISO parse on every call.
+    if updated_str[0] in "[<":
+        match = _ORG_TIMESTAMP_PATTERN.match(updated_str)
+        if match:
+            date_part, time_part = match.groups()
+            try:
+                return datetime.fromisoformat(f"{date_part}T{time_part}:00+00:00")
+            except ValueError:
+                return None
+        return None
+
+    try:
+        # ISO format (e.g., "2024-11-01T16:12:00Z"); Python 3.11+ accepts the "Z"
+        return datetime.fromisoformat(updated_str)
+    except ValueError:
+        return None
+
+
 class OrgTodoState(StrEnum):
     """Org-mode TODO states."""
 
@@ -104,62 +152,55 @@ class OrgTodoState(StrEnum):
     DONE = "DONE"
 
 
-class OrgHeading(BaseModel):
+@dataclass(slots=True)
+class OrgHeading:
     """
     Org-mode heading representation.
 
     This model captures the structure of an Org-mode heading including
     its properties drawer, content, tags, and child headings.
-    """
 
-    model_config = ConfigDict(frozen=False)  # Allow modification for merging
+    Unlike the GitHub models this is a plain slotted dataclass: headings are
+    built in bulk by the parser and merger from already-typed values, so
+    Pydantic validation would only add per-node construction cost.
+    """
 
-    level: int = Field(ge=1, le=10)
+    level: int
     title: str
     todo_state: OrgTodoState | None = None
-    tags: list[str] = Field(default_factory=list)
-    properties: dict[str, str] = Field(default_factory=dict)
+    tags: list[str] = field(default_factory=list)
+    properties: dict[str, str] = field(default_factory=dict)
     content: str = ""
-    children: list["OrgHeading"] = Field(default_factory=list)
+    children: list["OrgHeading"] = field(default_factory=list)
 
     # Source tracking for merge operations
     source_line: int | None = None  # Line number in original file
     raw_text: str | None = None  # Original raw text from file (for unchanged entries)
 
+    # Parsed values behind github_number/github_updated, cached together with
+    # the raw property string they came from so a changed property is re-parsed
+    _number_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _number: int | None = field(default=None, init=False, repr=False, compare=False)
+    _updated_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _updated: datetime | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def github_number(self) -> int | None:
         """Get GitHub issue number from properties if present."""
         num_str = self.properties.get("GITHUB_NUMBER")
-        if num_str:
-            try:
-                return int(num_str)
-            except ValueError:
-                return None
-        return None
+        if num_str is not self._number_src:
+            self._number_src = num_str
+            self._number = _parse_github_number(num_str)
+        return self._number
 
     @property
     def github_updated(self) -> datetime | None:
         """Get GitHub updated timestamp from properties if present."""
-        import re
-
         updated_str = self.properties.get("GITHUB_UPDATED")
-        if updated_str:
-            try:
-                # Try ISO format first (e.g., "2024-11-01T16:12:00Z")
-                return datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
-            except ValueError:
-                # Try Org-mode format: [2024-11-01 Fri 16:12]
-                match = re.match(
-                    r"[\[<](\d{4}-\d{2}-\d{2})\s+\w+\s+(\d{2}:\d{2})[\]>]", updated_str
-                )
-                if match:
-                    date_part, time_part = match.groups()
-                    try:
-                        return datetime.fromisoformat(f"{date_part}T{time_part}:00+00:00")
-                    except ValueError:
-                        return None
-                return None
-        return None
+        if updated_str is not self._updated_src:
+            self._updated_src = updated_str
+            self._updated = _parse_github_updated(updated_str)
+        return self._updated
 
     @property
     def is_github_synced(self) -> bool:
@@ -173,7 +214,8 @@ class OrgHeading(BaseModel):
 
     def has_tag(self, tag: str) -> bool:
         """Check if heading has a specific tag."""
-        return tag.upper() in [t.upper() for t in self.tags]
+        wanted = tag.upper()
+        return any(t.upper() == wanted for t in self.tags)
 
 
 class MergeAction(StrEnum):
@@ -185,11 +227,10 @@ class MergeAction(StrEnum):
     PRESERVED = "preserved"  # User content preserved
 
 
-class MergeEntry(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MergeEntry:
     """Record of a single merge operation."""
 
-    model_config = ConfigDict(frozen=True)
-
     issue_number: int
     title: str
     action: MergeAction
@@ -226,14 +267,12 @@ class MergeResult(BaseModel):
                 details=details,
             )
         )
-        if action == MergeAction.ADDED:
-            self.added += 1
-        elif action == MergeAction.UPDATED:
-            self.updated += 1
-        elif action == MergeAction.UNCHANGED:
-            self.unchanged += 1
-        elif action == MergeAction.PRESERVED:
-            self.preserved += 1
+        self.count(action)
+
+    def count(self, action: MergeAction) -> None:
+        """Update counters for an action that has no merge entry."""
+        # Each MergeAction value names its counter field
+        setattr(self, action.value, getattr(self, action.value) + 1)
 
     @property
     def has_changes(self) -> bool:
@@ -276,10 +315,10 @@ class SyncConfig(BaseModel):
     @property
     def owner(self) -> str:
         """Get repository owner."""
-        return self.repo.split("/")[0]
+        return self.repo.partition("/")[0]
 
     @property
     def repo_name(self) -> str:
         """Get repository name."""
-        parts = self.repo.split("/")
-        return parts[1] if len(parts) > 1 else parts[0]
+        owner, sep, rest = self.repo.partition("/")
+        return rest.partition("/")[0] if sep else owner
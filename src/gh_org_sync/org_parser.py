@@ -7,6 +7,7 @@ extracting headings, properties, tags, and content into structured data.
 
 import logging
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from .exceptions import OrgParseError
@@ -14,24 +15,29 @@ from .models import OrgHeading, OrgTodoState
 
 logger = logging.getLogger(__name__)
 
-# Regex patterns for Org-mode elements
+# Regex patterns for Org-mode elements. HEADING_PATTERN is matched against the
+# whole file in MULTILINE mode, so whitespace classes must not cross newlines.
 HEADING_PATTERN = re.compile(
     r"^(\*+)"  # Heading level (capture group 1)
-    r"\s+"  # Required whitespace
-    r"(?:(TODO|DONE)\s+)?"  # Optional TODO state (capture group 2)
+    r"[^\S\n]+"  # Required whitespace
+    r"(?:(TODO|DONE)[^\S\n]+)?"  # Optional TODO state (capture group 2)
     r"(.+?)"  # Title (capture group 3, non-greedy)
-    r"(?:\s+(:[a-zA-Z0-9_@#%:]+:))?"  # Optional tags (capture group 4)
-    r"\s*$"  # Trailing whitespace
+    r"(?:[^\S\n]+(:[a-zA-Z0-9_@#%:]+:))?"  # Optional tags (capture group 4)
+    r"[^\S\n]*$",  # Trailing whitespace
+    re.MULTILINE,
 )
 
-PROPERTY_DRAWER_START = re.compile(r"^\s*:PROPERTIES:\s*$", re.IGNORECASE)
-PROPERTY_DRAWER_END = re.compile(r"^\s*:END:\s*$", re.IGNORECASE)
-PROPERTY_LINE = re.compile(
-    r"^\s*:([A-Za-z0-9_-]+):\s*(.*?)\s*$"  # :NAME: value
-)
+# Drawer patterns are applied with pattern.match(text, pos, endpos) to one line
+# of an entry at a time, so they are anchored by match() rather than "^".
+PROPERTY_DRAWER_START = re.compile(r"\s*:PROPERTIES:\s*$", re.IGNORECASE)
 
-# File header patterns
-FILE_DIRECTIVE = re.compile(r"^#\+([A-Za-z_]+):\s*(.*)$")
+# Lines inside a drawer, dispatched on match.lastgroup in a single engine call
+DRAWER_LINE_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<end>(?i::END:))\s*$"  # :END: (case-insensitive)
+    r"|:(?P<name>[A-Za-z0-9_-]+):\s*(?P<value>.*?)\s*$"  # :NAME: value
+    r")"
+)
 
 
 class OrgParser:
@@ -39,14 +45,10 @@ class OrgParser:
     Parser for Org-mode files.
 
     Parses Org files into a tree structure of OrgHeading objects,
-    preserving properties, tags, and content.
+    preserving properties, tags, and content. The parser keeps no per-parse
+    state, so a single instance can be reused for any number of files.
     """
 
-    def __init__(self) -> None:
-        """Initialize the parser."""
-        self._current_line = 0
-        self._file_path: str = ""
-
     def parse_file(self, path: Path | str) -> list[OrgHeading]:
         """
         Parse an Org-mode file into a list of headings.
@@ -61,7 +63,6 @@ class OrgParser:
             OrgParseError: If file cannot be read or parsed
         """
         path = Path(path)
-        self._file_path = str(path)
 
         if not path.exists():
             logger.debug(f"File does not exist: {path}")
@@ -84,59 +85,50 @@ class OrgParser:
         Returns:
             List of top-level OrgHeading objects
         """
-        lines = content.split("\n")
-        self._current_line = 0
+        # Locate headings directly in the raw text; each entry runs up to the
+        # next heading, so only the entries themselves are ever sliced out.
+        matches = list(HEADING_PATTERN.finditer(content))
+        if not matches:
+            return []
+
+        # Each entry ends just before the newline that precedes the next heading
+        ends = [m.start() - 1 for m in matches[1:]]
+        ends.append(len(content))
 
-        # Parse into flat list first
+        # Parse into flat list first. This loop runs once per heading, so the
+        # callables it needs are bound to locals up front.
         flat_headings: list[OrgHeading] = []
-        preamble_lines: list[str] = []  # Lines before first heading
-        in_preamble = True
-
-        i = 0
-        while i < len(lines):
-            self._current_line = i + 1
-            line = lines[i]
-
-            # Check for heading
-            heading_match = HEADING_PATTERN.match(line)
-            if heading_match:
-                in_preamble = False
-                heading, consumed = self._parse_heading(lines, i)
-                flat_headings.append(heading)
-                i += consumed
-            else:
-                if in_preamble:
-                    preamble_lines.append(line)
-                i += 1
+        append = flat_headings.append
+        parse_heading = self._parse_heading
+        count = content.count
+        line_number = 1
+        prev_start = 0
+        for match, end in zip(matches, ends, strict=True):
+            start = match.start()
+            line_number += count("\n", prev_start, start)
+            prev_start = start
+            append(parse_heading(content[start:end], match, line_number))
 
         # Build tree structure from flat list
         return self._build_tree(flat_headings)
 
     def _parse_heading(
         self,
-        lines: list[str],
-        start_index: int,
-    ) -> tuple[OrgHeading, int]:
+        raw_text: str,
+        match: re.Match[str],
+        source_line: int,
+    ) -> OrgHeading:
         """
         Parse a heading and its content.
 
         Args:
-            lines: All lines in the file
-            start_index: Index of the heading line
+            raw_text: Entry text from the heading line up to the next heading
+            match: HEADING_PATTERN match for the heading line
+            source_line: 1-based line number of the heading line
 
         Returns:
-            Tuple of (OrgHeading, number of lines consumed)
+            Parsed OrgHeading
         """
-        line = lines[start_index]
-        match = HEADING_PATTERN.match(line)
-
-        if not match:
-            raise OrgParseError(
-                self._file_path,
-                line=start_index + 1,
-                details=f"Expected heading but found: {line[:50]}...",
-            )
-
         stars, todo_state, title, tags_str = match.groups()
 
         # Parse level
@@ -153,8 +145,10 @@ class OrgParser:
         # Parse tags
         tags: list[str] = []
         if tags_str:
-            # Remove surrounding colons and split
-            tags = [t for t in tags_str.strip(":").split(":") if t]
+            # The pattern guarantees surrounding colons; drop the empty ends
+            tags = tags_str.split(":")[1:-1]
+            if "::" in tags_str:
+                tags = [t for t in tags if t]
 
         # Initialize heading
         heading = OrgHeading(
@@ -165,85 +159,64 @@ class OrgParser:
             properties={},
             content="",
             children=[],
-            source_line=start_index + 1,
+            source_line=source_line,
+            raw_text=raw_text,
         )
 
-        # Parse content following the heading
-        content_lines: list[str] = []
-        i = start_index + 1
-        consumed = 1
-
-        # First, check for properties drawer
-        if i < len(lines) and PROPERTY_DRAWER_START.match(lines[i]):
-            props, prop_lines = self._parse_properties_drawer(lines, i)
-            heading.properties = props
-            i += prop_lines
-            consumed += prop_lines
-
-        # Then collect content until next heading of same or higher level
-        while i < len(lines):
-            line = lines[i]
-
-            # Check if this is a heading
-            heading_match = HEADING_PATTERN.match(line)
-            if heading_match:
-                next_level = len(heading_match.group(1))
-                # Stop if same level or higher (parent/sibling)
-                if next_level <= level:
-                    break
-                # Otherwise it's a child - stop here, will be parsed separately
-                break
-
-            content_lines.append(line)
-            i += 1
-            consumed += 1
-
-        # Join content, stripping trailing empty lines
-        heading.content = "\n".join(content_lines).rstrip()
+        # The body starts on the line after the heading
+        pos = raw_text.find("\n") + 1
+        if pos:
+            # First, check for properties drawer
+            line_end = raw_text.find("\n", pos)
+            if line_end == -1:
+                line_end = len(raw_text)
+            if raw_text.find(":", pos, line_end) != -1 and PROPERTY_DRAWER_START.match(
+                raw_text, pos, line_end
+            ):
+                heading.properties, pos = self._parse_properties_drawer(raw_text, line_end + 1)
 
-        # Store raw text (from heading line to end of entry, excluding children)
-        end_index = start_index + consumed
-        raw_lines = lines[start_index:end_index]
-        heading.raw_text = "\n".join(raw_lines)
+            # Content runs until the next heading, stripping trailing empty lines
+            heading.content = raw_text[pos:].rstrip()
 
-        return heading, consumed
+        return heading
 
     def _parse_properties_drawer(
         self,
-        lines: list[str],
-        start_index: int,
+        text: str,
+        pos: int,
     ) -> tuple[dict[str, str], int]:
         """
-        Parse a :PROPERTIES: drawer.
+        Parse the lines of a :PROPERTIES: drawer.
 
         Args:
-            lines: All lines in the file
-            start_index: Index of :PROPERTIES: line
+            text: Raw text of the enclosing entry
+            pos: Offset of the line following :PROPERTIES:
 
         Returns:
-            Tuple of (properties dict, number of lines consumed)
+            Tuple of (properties dict, offset of the first line after :END:)
         """
         properties: dict[str, str] = {}
-        i = start_index + 1  # Skip :PROPERTIES: line
-        consumed = 1
-
-        while i < len(lines):
-            line = lines[i]
-            consumed += 1
-
-            # Check for :END:
-            if PROPERTY_DRAWER_END.match(line):
-                break
-
-            # Parse property
-            prop_match = PROPERTY_LINE.match(line)
-            if prop_match:
-                name, value = prop_match.groups()
-                properties[name.upper()] = value
+        match_line = DRAWER_LINE_PATTERN.match
+        find = text.find
+        text_end = len(text)
+
+        # Every offset up to and including text_end starts a line
+        while pos <= text_end:
+            line_end = find("\n", pos)
+            if line_end == -1:
+                line_end = text_end
+
+            drawer_match = match_line(text, pos, line_end)
+            pos = line_end + 1
+            if drawer_match:
+                # Check for :END:
+                if drawer_match.lastgroup == "end":
+                    break
 
-            i += 1
+                # Parse property
+                properties[drawer_match["name"].upper()] = drawer_match["value"]
 
-        return properties, consumed
+        return properties, pos
 
     def _build_tree(self, flat_headings: list[OrgHeading]) -> list[OrgHeading]:
         """
@@ -257,27 +230,21 @@ class OrgParser:
         Returns:
             List of top-level headings with children nested
         """
-        if not flat_headings:
-            return []
-
-        result: list[OrgHeading] = []
+        root_children: list[OrgHeading] = []
         stack: list[OrgHeading] = []
+        stack_pop = stack.pop
+        stack_append = stack.append
 
         for heading in flat_headings:
             # Pop from stack until we find a potential parent
             while stack and stack[-1].level >= heading.level:
-                stack.pop()
-
-            if not stack:
-                # Top-level heading
-                result.append(heading)
-            else:
-                # Child of the heading at top of stack
-                stack[-1].children.append(heading)
+                stack_pop()
 
-            stack.append(heading)
+            # Child of the heading at top of stack, or a top-level heading
+            (stack[-1].children if stack else root_children).append(heading)
+            stack_append(heading)
 
-        return result
+        return root_children
 
     def extract_file_metadata(self, path: Path | str) -> dict[str, str]:
         """
@@ -302,10 +269,16 @@ class OrgParser:
                     if line.startswith("*"):
                         break
 
-                    match = FILE_DIRECTIVE.match(line)
-                    if match:
-                        name, value = match.groups()
-                        metadata[name.upper()] = value.strip()
+                    if not line.startswith("#+"):
+                        continue
+
+                    # "#+NAME: value", where NAME is ASCII letters/underscores
+                    colon = line.find(":", 2)
+                    if colon == -1:
+                        continue
+                    name = line[2:colon]
+                    if name.isascii() and name.replace("_", "a").isalpha():
+                        metadata[name.upper()] = line[colon + 1 :].strip()
         except OSError:
             pass
 
@@ -320,7 +293,7 @@ def find_heading_by_property(
     """
     Find a heading with a specific property value.
 
-    Searches recursively through all headings and children.
+    Searches depth-first through all headings and children, in document order.
 
     Args:
         headings: List of headings to search
@@ -332,19 +305,10 @@ def find_heading_by_property(
     """
     prop_upper = property_name.upper()
 
-    for heading in headings:
+    for heading in _iter_headings(headings):
         if heading.properties.get(prop_upper) == property_value:
             return heading
 
-        # Search children
-        child_result = find_heading_by_property(
-            heading.children,
-            property_name,
-            property_value,
-        )
-        if child_result:
-            return child_result
-
     return None
 
 
@@ -373,12 +337,16 @@ def collect_all_headings(headings: list[OrgHeading]) -> list[OrgHeading]:
         headings: List of potentially nested headings
 
     Returns:
-        Flat list of all headings
+        Flat list of all headings, in document order
     """
-    result: list[OrgHeading] = []
+    return list(_iter_headings(headings))
 
-    for heading in headings:
-        result.append(heading)
-        result.extend(collect_all_headings(heading.children))
 
-    return result
+def _iter_headings(headings: list[OrgHeading]) -> Iterator[OrgHeading]:
+    """Iterate over a heading tree in document order using an explicit stack."""
+    stack = headings[::-1]
+    while stack:
+        heading = stack.pop()
+        yield heading
+        if heading.children:
+            stack.extend(reversed(heading.children))
@@ -6,10 +6,14 @@ with proper escaping, formatting, and atomic write operations.
 """
 
 import logging
+import os
 import re
 import shutil
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from .exceptions import OrgBackupError, OrgWriteError
@@ -17,6 +21,53 @@ from .models import GitHubIssue, OrgHeading
 
 logger = logging.getLogger(__name__)
 
+# Start of a content line that Org would read as syntax: a heading star
+# ("*" alone or followed by a space), a "#" comment (but not a "#+" keyword),
+# or a ":NAME:" property/drawer marker. Group 1 is the indentation.
+_ESCAPE_LINE_START = re.compile(
+    r"^([^\S\n]*)(?=\*(?: |$)|#(?!\+)|:[A-Za-z_][A-Za-z0-9_-]*:)",
+    re.MULTILINE,
+)
+
+# Org timestamps always use English day names, independent of the C locale
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Heading star prefixes for common depths; see _stars()
+_STARS = tuple("*" * n for n in range(16))
+
+# Characters not allowed in tags
+_TAG_INVALID_CHARS = re.compile(r"[:\s]+")
+
+# Markdown constructs converted by markdown_to_org(), as one alternation so
+# the text is scanned once and converted output is never re-read. At a given
+# position the earlier alternative wins.
+_MD_INLINE = re.compile(
+    # Every construct opens with one of these; lets the scan skip plain text
+    r"(?=[`\[*_~])(?:"
+    # Fenced code blocks (```lang ... ```) become Org source blocks
+    r"(?P<code>```(?P<lang>\w*)\n(?P<src>.*?)```)"
+    # Links [text](url) become [[url][text]]; skip already-escaped brackets
+    r"|(?P<link>(?<!\[)\[(?P<link_text>[^\]]+)\]\((?P<url>[^)]+)\))"
+    # Inline code `code` becomes =code=; never spans lines
+    r"|(?P<verbatim>`(?P<verbatim_text>[^`\n]+)`)"
+    # Bold **text** and __text__ become *text*
+    r"|(?P<bold>\*\*(?P<bold_stars>[^*]+)\*\*|__(?P<bold_underscores>[^_]+)__)"
+    # Italic *text* and _text_ become /text/; only after whitespace, so list
+    # items and words with inner underscores are left alone
+    r"|(?P<italic>(?<=\s)(?:\*(?P<italic_star>[^*\n]+)\*|_(?P<italic_underscore>[^_\n]+)_)"
+    r"(?=\s|$|[.,;:!?]))"
+    # Strikethrough ~~text~~ becomes +text+
+    r"|(?P<strike>~~(?P<strike_text>[^~]+)~~))",
+    re.DOTALL,
+)
+
+
+# A run of consecutive "> " quoted lines, and the quote marker on each line.
+# Both open with the literal ">" (then look back for a line start) so the
+# regex engine can jump between candidate ">" characters.
+_MD_BLOCKQUOTE = re.compile(r">(?<![^\n]>)[^\n]*\n?(?:>[^\n]*\n?)*")
+_MD_QUOTE_MARKER = re.compile(r">(?<![^\n]>) ?")
+
 
 def normalize_line_endings(text: str) -> str:
     """
@@ -34,6 +85,37 @@ def normalize_line_endings(text: str) -> str:
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
+def _convert_markdown(match: re.Match[str]) -> str:
+    """Return the Org replacement for one _MD_INLINE match."""
+    kind = match.lastgroup
+    if kind == "code":
+        lang = match["lang"]
+        if lang:
+            return f"#+BEGIN_SRC {lang}\n{match['src']}#+END_SRC"
+        return f"#+BEGIN_SRC\n{match['src']}#+END_SRC"
+    if kind == "verbatim":
+        return f"={match['verbatim_text']}="
+    # Markup may nest inside link text, bold, italic and strikethrough
+    if kind == "link":
+        return f"[[{match['url']}][{_MD_INLINE.sub(_convert_markdown, match['link_text'])}]]"
+    if kind == "bold":
+        inner = match["bold_stars"] or match["bold_underscores"]
+        return f"*{_MD_INLINE.sub(_convert_markdown, inner)}*"
+    if kind == "italic":
+        inner = match["italic_star"] or match["italic_underscore"]
+        return f"/{_MD_INLINE.sub(_convert_markdown, inner)}/"
+    return f"+{_MD_INLINE.sub(_convert_markdown, match['strike_text'])}+"
+
+
+def _convert_blockquote(match: re.Match[str]) -> str:
+    """Replace a run of quoted lines with an Org quote block."""
+    block = match.group(0)
+    body = _MD_QUOTE_MARKER.sub("", block)
+    if block.endswith("\n"):
+        return f"#+BEGIN_QUOTE\n{body[:-1]}\n#+END_QUOTE\n"
+    return f"#+BEGIN_QUOTE\n{body}\n#+END_QUOTE"
+
+
 def markdown_to_org(text: str) -> str:
     """
     Convert Markdown markup to Org-mode equivalents.
@@ -46,6 +128,12 @@ def markdown_to_org(text: str) -> str:
     - `code` → =code=
     - ~~strikethrough~~ → +strikethrough+
     - ```code blocks``` → #+BEGIN_SRC / #+END_SRC
+    - > quote → #+BEGIN_QUOTE / #+END_QUOTE
+
+    Markup nests inside link text, bold, italic and strikethrough, but the
+    contents of code spans, code blocks and link URLs are left untouched.
+    Matching is leftmost-first, so an emphasis span that opens earlier and
+    closes inside a code span wins over it: **`**` becomes *`*`.
 
     Args:
         text: Text with Markdown markup
@@ -59,79 +147,18 @@ def markdown_to_org(text: str) -> str:
     # Normalize line endings first
     text = normalize_line_endings(text)
 
-    # Convert fenced code blocks (```lang ... ```) to Org source blocks
-    # Must be done before other conversions to avoid mangling code content
-    def convert_code_block(match: re.Match[str]) -> str:
-        lang = match.group(1) or ""
-        code = match.group(2)
-        if lang:
-            return f"#+BEGIN_SRC {lang}\n{code}#+END_SRC"
-        return f"#+BEGIN_SRC\n{code}#+END_SRC"
-
-    text = re.sub(
-        r"```(\w*)\n(.*?)```",
-        convert_code_block,
-        text,
-        flags=re.DOTALL,
-    )
-
-    # Convert Markdown links [text](url) to Org links [[url][text]]
-    # Be careful not to match already-escaped brackets
-    text = re.sub(
-        r"(?<!\[)\[([^\]]+)\]\(([^)]+)\)",
-        r"[[\2][\1]]",
-        text,
-    )
-
-    # Convert inline code `code` to Org verbatim =code=
-    # Use non-greedy match and avoid matching code that spans lines
-    text = re.sub(r"`([^`\n]+)`", r"=\1=", text)
-
-    # Convert bold **text** to Org *text*
-    text = re.sub(r"\*\*([^*]+)\*\*", r"*\1*", text)
-
-    # Convert bold __text__ to Org *text*
-    text = re.sub(r"__([^_]+)__", r"*\1*", text)
-
-    # Convert italic *text* to Org /text/ (single asterisks not already bold)
-    # This is tricky - we need to avoid matching list items
-    # Only convert if preceded by whitespace or start of line
-    text = re.sub(r"(?<=\s)\*([^*\n]+)\*(?=\s|$|[.,;:!?])", r"/\1/", text)
-
-    # Convert italic _text_ to Org /text/
-    # Only match word-bounded underscores
-    text = re.sub(r"(?<=\s)_([^_\n]+)_(?=\s|$|[.,;:!?])", r"/\1/", text)
-
-    # Convert strikethrough ~~text~~ to Org +text+
-    text = re.sub(r"~~([^~]+)~~", r"+\1+", text)
+    # Convert inline markup and code blocks in a single pass; code is copied
+    # verbatim and converted markup is not matched again. Every construct
+    # opens with one of these characters, so plain prose skips the regex.
+    if "`" in text or "*" in text or "_" in text or "~" in text or "[" in text:
+        text = _MD_INLINE.sub(_convert_markdown, text)
 
     # Convert blockquotes > text to Org-mode style
     # Multi-line blockquotes become #+BEGIN_QUOTE blocks
-    lines = text.split("\n")
-    result_lines: list[str] = []
-    in_blockquote = False
-
-    for line in lines:
-        if line.startswith("> "):
-            if not in_blockquote:
-                result_lines.append("#+BEGIN_QUOTE")
-                in_blockquote = True
-            result_lines.append(line[2:])  # Remove "> " prefix
-        elif line.startswith(">"):
-            if not in_blockquote:
-                result_lines.append("#+BEGIN_QUOTE")
-                in_blockquote = True
-            result_lines.append(line[1:])  # Remove ">" prefix
-        else:
-            if in_blockquote:
-                result_lines.append("#+END_QUOTE")
-                in_blockquote = False
-            result_lines.append(line)
+    if not text.startswith(">") and "\n>" not in text:
+        return text  # No quoted lines
 
-    if in_blockquote:
-        result_lines.append("#+END_QUOTE")
-
-    return "\n".join(result_lines)
+    return _MD_BLOCKQUOTE.sub(_convert_blockquote, text)
 
 
 def escape_org_content(text: str) -> str:
@@ -156,40 +183,19 @@ def escape_org_content(text: str) -> str:
     # First convert Markdown to Org-mode (also normalizes line endings)
     text = markdown_to_org(text)
 
-    lines = text.split("\n")
-    escaped_lines: list[str] = []
-
-    for line in lines:
-        stripped = line.lstrip()
-        if not stripped:
-            escaped_lines.append(line)
-            continue
-
-        indent = line[: len(line) - len(stripped)]
-        needs_escape = False
-
-        # Check for special line-start patterns
-        # Escape asterisks that aren't part of Org bold markup
-        if stripped.startswith("*") and not re.match(r"^\*[^*\s].*[^*\s]\*", stripped):
-            # Looks like a heading marker, not bold text
-            if not stripped.startswith("*") or len(stripped) == 1 or stripped[1] == " ":
-                needs_escape = True
-        # Escape hash that could look like Org keywords
-        elif stripped.startswith("#") and not stripped.startswith("#+"):
-            needs_escape = True
-        elif stripped.startswith(":") and ":" in stripped[1:]:
-            # Check if it looks like a property :NAME:
-            colon_pos = stripped.index(":", 1)
-            potential_keyword = stripped[1:colon_pos]
-            if potential_keyword and re.match(r"^[A-Za-z_][A-Za-z0-9_-]*$", potential_keyword):
-                needs_escape = True
+    # Every escapable line starts with one of these characters; most prose
+    # contains none of them, so skip the line-by-line regex scan entirely
+    if "*" not in text and "#" not in text and ":" not in text:
+        return text
 
-        if needs_escape:
-            line = indent + ", " + stripped
+    # Prefix ", " (after any indentation) to every line that would otherwise
+    # be read as Org syntax, in a single pass over the text
+    return _ESCAPE_LINE_START.sub(r"\1, ", text)
 
-        escaped_lines.append(line)
 
-    return "\n".join(escaped_lines)
+def _stars(level: int) -> str:
+    """Return the star prefix for a heading level, reusing cached strings."""
+    return _STARS[level] if 0 <= level < len(_STARS) else "*" * level
 
 
 def format_timestamp(dt: datetime, active: bool = False) -> str:
@@ -203,8 +209,29 @@ def format_timestamp(dt: datetime, active: bool = False) -> str:
     Returns:
         Formatted timestamp like [2024-01-15 Mon 10:30]
     """
-    bracket = ("<", ">") if active else ("[", "]")
-    return f"{bracket[0]}{dt.strftime('%Y-%m-%d %a %H:%M')}{bracket[1]}"
+    open_, close = ("<", ">") if active else ("[", "]")
+    return (
+        f"{open_}{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {_WEEKDAY_ABBR[dt.weekday()]} "
+        f"{dt.hour:02d}:{dt.minute:02d}{close}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def clean_tag(tag: str) -> str:
+    """
+    Turn a label into a valid Org tag.
+
+    Runs of colons and whitespace become underscores, and leading or trailing
+    underscores are dropped. Cached, since the same labels recur on most
+    issues of a repository.
+
+    Args:
+        tag: Raw label or tag text
+
+    Returns:
+        Cleaned tag (empty if nothing usable remains)
+    """
+    return _TAG_INVALID_CHARS.sub("_", tag.strip()).strip("_")
 
 
 def format_tags(tags: list[str], include_link: bool = True) -> str:
@@ -226,11 +253,9 @@ def format_tags(tags: list[str], include_link: bool = True) -> str:
     for tag in tags:
         if not tag:
             continue
-        # Clean tag: replace invalid characters with underscores
-        clean_tag = re.sub(r"[:\s]+", "_", tag.strip())
-        clean_tag = clean_tag.strip("_")
-        if clean_tag:
-            all_tags.append(clean_tag)
+        cleaned = clean_tag(tag)
+        if cleaned:
+            all_tags.append(cleaned)
 
     if not all_tags:
         return ""
@@ -255,34 +280,155 @@ def format_properties(
     Returns:
         Formatted properties drawer
     """
+    return "\n".join(_property_lines(properties, indent, target_column))
+
+
+@lru_cache(maxsize=256)
+def _property_prefix(key: str, indent: str, target_column: int) -> str:
+    """
+    Return the ":NAME:" prefix and padding for one property line.
+
+    Property names repeat across every issue, so the upper-casing and padding
+    are computed once per (name, indent, column) combination.
+    """
+    key_upper = str(key).upper()
+    # Property prefix is ":NAME:" which is len(NAME) + 2
+    prop_prefix_len = len(key_upper) + 2
+    # Pad to the target column, or use 1 space if the prefix already reaches it
+    padding = " " * max(target_column - prop_prefix_len, 1)
+    return f"{indent}:{key_upper}:{padding}"
+
+
+def _property_lines(
+    properties: Mapping[str, str | int | datetime | None],
+    indent: str = "",
+    target_column: int = 11,
+) -> list[str]:
+    """Format a PROPERTIES drawer as a list of lines (empty if no values)."""
     if not properties:
-        return ""
+        return []
+
+    # Filter out None and blank values; only strings can be blank, so ints and
+    # datetimes are kept without a throwaway str() conversion. Keys are unique,
+    # so sorting on the key alone gives the same order as sorting the items.
+    items = sorted(
+        [
+            (k, v)
+            for k, v in properties.items()
+            if v is not None and (not isinstance(v, str) or v.strip())
+        ],
+        key=itemgetter(0),
+    )
 
-    lines = [f"{indent}:PROPERTIES:"]
+    if not items:
+        return []
 
-    # Filter out None values
-    valid_props = {k: v for k, v in properties.items() if v is not None and str(v).strip()}
+    # Format value based on type (use Org-mode timestamp for datetime)
+    return [
+        f"{indent}:PROPERTIES:",
+        *[
+            _property_prefix(key, indent, target_column)
+            + (format_timestamp(value) if isinstance(value, datetime) else str(value))
+            for key, value in items
+        ],
+        f"{indent}:END:",
+    ]
 
-    if not valid_props:
-        return ""
 
-    for key, value in sorted(valid_props.items()):
-        # Format value based on type (use Org-mode timestamp for datetime)
-        value_str = format_timestamp(value) if isinstance(value, datetime) else str(value)
+def _issue_property_lines(issue: GitHubIssue, state: str, closed_stamp: str | None) -> list[str]:
+    """
+    Format the PROPERTIES drawer of an issue as a list of lines.
 
-        key_upper = str(key).upper()
-        # Property prefix is ":NAME:" which is len(NAME) + 2
-        prop_prefix_len = len(key_upper) + 2
-        # If prefix >= target column, use 1 space; otherwise pad to target column
-        if prop_prefix_len >= target_column:
-            padding = " "
-        else:
-            padding = " " * (target_column - prop_prefix_len)
-        lines.append(f"{indent}:{key_upper}:{padding}{value_str}")
+    Specialized form of _property_lines() for the fixed set of issue
+    properties: keys are already in sorted order and pre-padded to the
+    default value column, and blank strings are skipped the same way.
+    """
+    lines = [":PROPERTIES:"]
+    append = lines.append
+
+    assignees = ", ".join(issue.assignee_logins)
+    if assignees.strip():
+        append(f":ASSIGNEES: {assignees}")
+    login = issue.author.login
+    if login.strip():
+        append(f":AUTHOR:   {login}")
+    if closed_stamp:
+        append(f":CLOSED:   {closed_stamp}")
+    append(f":CREATED:  {format_timestamp(issue.created_at)}")
+    append(f":GITHUB_NUMBER: {issue.number}")
+    append(f":GITHUB_STATE: {state}")
+    append(f":GITHUB_UPDATED: {format_timestamp(issue.updated_at)}")
+    milestone = issue.milestone
+    if milestone and milestone.title.strip():
+        append(f":MILESTONE: {milestone.title}")
+    url = str(issue.url)
+    if url.strip():
+        append(f":URL:      {url}")
+
+    append(":END:")
+    return lines
+
+
+# Buffer size for streaming output files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _join_lines(blocks: Iterable[str]) -> Iterator[str]:
+    """Yield blocks separated by newlines; a lazy equivalent of "\n".join()."""
+    blocks = iter(blocks)
+    for block in blocks:
+        yield block
+        break
+    for block in blocks:
+        yield "\n"
+        yield block
+
+
+def _write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """
+    Stream text chunks to a file as UTF-8, ending in exactly one newline.
 
-    lines.append(f"{indent}:END:")
+    The result is the same as writing "".join(chunks).rstrip() + "\n", but
+    only one chunk is held in memory at a time: trailing whitespace is held
+    back until a later chunk shows it is not the end of the file.
+    """
+    with path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        pending = ""
+        for chunk in chunks:
+            body = chunk.rstrip()
+            if body:
+                if pending:
+                    f.write(pending.encode("utf-8"))
+                f.write(body.encode("utf-8"))
+                pending = chunk[len(body) :]
+            else:
+                pending += chunk
+        f.write(b"\n")
+
+
+def _backup_file(path: Path, backup_path: Path) -> None:
+    """
+    Preserve the current contents of path at backup_path.
 
-    return "\n".join(lines)
+    The file is replaced by renaming a new file over it, which leaves the old
+    inode untouched, so a hard link is a full backup without copying any
+    data. Falls back to copying where hard links are not supported.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    try:
+        try:
+            os.link(path, backup_path)
+        except FileExistsError:
+            # Replace the previous backup
+            backup_path.unlink()
+            os.link(path, backup_path)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # No hard links here (e.g. across devices, or on FAT/SMB filesystems)
+        shutil.copy2(path, backup_path)
 
 
 class OrgWriter:
@@ -310,6 +456,7 @@ class OrgWriter:
         title: str,
         repo: str,
         description: str = "",
+        sync_time: datetime | None = None,
     ) -> str:
         """
         Format Org-mode file header.
@@ -318,20 +465,21 @@ class OrgWriter:
             title: File title
             repo: Repository name
             description: Optional description
+            sync_time: Time recorded as SYNC_TIME (default: now, in UTC);
+                bulk exports can pass one timestamp for every file
 
         Returns:
             Formatted header
         """
         desc = description if description else f"GitHub issues synced from {repo}"
-        lines = [
-            f"#+TITLE: {title}",
-            f"#+DESCRIPTION: {desc}",
-            "#+STARTUP: overview",
-            f"#+SYNC_REPO: {repo}",
-            f"#+SYNC_TIME: {datetime.now(UTC).isoformat()}",
-            "",
-        ]
-        return "\n".join(lines)
+        stamp = (sync_time or datetime.now(UTC)).isoformat()
+        return (
+            f"#+TITLE: {title}\n"
+            f"#+DESCRIPTION: {desc}\n"
+            "#+STARTUP: overview\n"
+            f"#+SYNC_REPO: {repo}\n"
+            f"#+SYNC_TIME: {stamp}\n"
+        )
 
     def format_issue_heading(self, issue: GitHubIssue, level: int = 1) -> str:
         """
@@ -344,11 +492,18 @@ class OrgWriter:
         Returns:
             Formatted Org-mode heading with properties and content
         """
+        return "\n".join(self._issue_lines(issue, level))
+
+    def _issue_lines(self, issue: GitHubIssue, level: int) -> list[str]:
+        """Build the lines of format_issue_heading() without joining them."""
         lines: list[str] = []
+        state = issue.state.value
+        is_closed = state == "closed"
+        closed_at = issue.closed_at
 
         # Heading line
-        stars = "*" * level
-        todo_state = "DONE" if issue.state.value == "closed" else "TODO"
+        stars = _stars(level)
+        todo_state = "DONE" if is_closed else "TODO"
         tags = format_tags(issue.label_names, include_link=self.add_link_tag)
 
         if tags:
@@ -359,40 +514,24 @@ class OrgWriter:
         lines.append(heading)
 
         # Properties drawer
-        properties: dict[str, str | int | datetime | None] = {
-            "GITHUB_NUMBER": issue.number,
-            "URL": str(issue.url),
-            "GITHUB_STATE": issue.state.value,
-            "GITHUB_UPDATED": issue.updated_at,
-            "CREATED": issue.created_at,
-            "AUTHOR": issue.author.login,
-        }
-
-        if issue.assignee_logins:
-            properties["ASSIGNEES"] = ", ".join(issue.assignee_logins)
-        if issue.milestone:
-            properties["MILESTONE"] = issue.milestone.title
-        if issue.closed_at:
-            properties["CLOSED"] = issue.closed_at
-
-        props_text = format_properties(properties)
-        if props_text:
-            lines.append(props_text)
+        closed_stamp = format_timestamp(closed_at) if closed_at else None
+        lines.extend(_issue_property_lines(issue, state, closed_stamp))
 
         # CLOSED timestamp for done items (Org convention)
-        if issue.state.value == "closed" and issue.closed_at:
-            lines.append(f"CLOSED: {format_timestamp(issue.closed_at)}")
+        if is_closed and closed_stamp:
+            lines.append(f"CLOSED: {closed_stamp}")
 
         # Body
-        if issue.body:
-            escaped_body = escape_org_content(issue.body.strip())
-            lines.append(escaped_body)
+        body = issue.body
+        if body:
+            lines.append(escape_org_content(body.strip()))
 
         # Comments as sub-headings
-        if issue.comments:
-            comment_stars = "*" * (level + 1)
+        comments = issue.comments
+        if comments:
+            comment_stars = _stars(level + 1)
 
-            for comment in sorted(issue.comments, key=lambda c: c.created_at):
+            for comment in comments:
                 timestamp = format_timestamp(comment.created_at)
                 lines.append(f"{comment_stars} Comment by @{comment.author.login} {timestamp}")
 
@@ -400,7 +539,7 @@ class OrgWriter:
                     escaped_comment = escape_org_content(comment.body.strip())
                     lines.append(escaped_comment)
 
-        return "\n".join(lines)
+        return lines
 
     def format_heading(self, heading: OrgHeading) -> str:
         """
@@ -413,14 +552,18 @@ class OrgWriter:
             Formatted Org-mode text
         """
         lines: list[str] = []
+        self._append_heading_lines(heading, lines)
+        return "\n".join(lines)
 
+    def _append_heading_lines(self, heading: OrgHeading, lines: list[str]) -> None:
+        """Append the lines of format_heading() for a heading and its children."""
         # If raw_text is available, use it directly (preserves original formatting)
         if heading.raw_text is not None:
             lines.append(heading.raw_text)
         else:
             # Otherwise, generate from scratch
             # Heading line
-            stars = "*" * heading.level
+            stars = _stars(heading.level)
             parts = [stars]
 
             if heading.todo_state:
@@ -435,9 +578,7 @@ class OrgWriter:
 
             # Properties drawer
             if heading.properties:
-                props_text = format_properties(heading.properties)
-                if props_text:
-                    lines.append(props_text)
+                lines.extend(_property_lines(heading.properties))
 
             # Content
             if heading.content:
@@ -446,9 +587,7 @@ class OrgWriter:
         # Children (always appended regardless of raw_text)
         for child in heading.children:
             lines.append("")
-            lines.append(self.format_heading(child))
-
-        return "\n".join(lines)
+            self._append_heading_lines(child, lines)
 
     def write_file(
         self,
@@ -472,51 +611,13 @@ class OrgWriter:
             OrgWriteError: If write fails
             OrgBackupError: If backup fails
         """
-        path = Path(path)
-
-        # Create backup if file exists
-        if backup and path.exists():
-            backup_path = path.with_suffix(path.suffix + ".bak")
-            try:
-                shutil.copy2(path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            except OSError as e:
-                raise OrgBackupError(str(path), str(e)) from e
-
-        # Build content
-        content_parts: list[str] = []
-
-        if header:
-            content_parts.append(header)
+        # Content is produced one top-level heading at a time while writing
+        blocks = (self.format_heading(heading) for heading in headings)
+        chunks = _join_lines(chain([header], blocks) if header else blocks)
 
-        for heading in headings:
-            content_parts.append(self.format_heading(heading))
-
-        content = "\n".join(content_parts)
-
-        # Ensure single trailing newline
-        content = content.rstrip() + "\n"
-
-        # Atomic write
-        temp_path = path.with_suffix(path.suffix + ".tmp")
-
-        try:
-            # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to temp file
-            temp_path.write_text(content, encoding="utf-8")
-
-            # Rename to final location
-            temp_path.replace(path)
-
-            logger.info(f"Wrote {len(headings)} headings to {path}")
-
-        except OSError as e:
-            # Clean up temp file if it exists
-            if temp_path.exists():
-                temp_path.unlink()
-            raise OrgWriteError(str(path), str(e)) from e
+        path = Path(path)
+        self._atomic_write(path, chunks, backup)
+        logger.info(f"Wrote {len(headings)} headings to {path}")
 
     def write_issues(
         self,
@@ -524,6 +625,7 @@ class OrgWriter:
         path: Path | str,
         repo: str,
         backup: bool = True,
+        sync_time: datetime | None = None,
     ) -> None:
         """
         Write GitHub issues directly to an Org file.
@@ -536,40 +638,62 @@ class OrgWriter:
             path: Output file path
             repo: Repository name for header
             backup: Whether to create backup
+            sync_time: Time recorded in the header (default: now)
         """
-        path = Path(path)
-
-        # Build content
-        content_parts: list[str] = []
+        # Header, then issues; formatted one issue at a time while writing
+        header = self.format_file_header(f"GitHub Issues: {repo}", repo, sync_time=sync_time)
+        # Providers already return issues by number; Timsort handles that in one pass
+        ordered = sorted(issues, key=attrgetter("number"))
+        blocks = map(self.format_issue_heading, ordered)
+        chunks = _join_lines(chain([header], blocks))
 
-        # Header
-        content_parts.append(self.format_file_header(f"GitHub Issues: {repo}", repo))
+        path = Path(path)
+        self._atomic_write(path, chunks, backup)
+        logger.info(f"Wrote {len(issues)} issues to {path}")
 
-        # Issues
-        for issue in sorted(issues, key=lambda i: i.number):
-            content_parts.append(self.format_issue_heading(issue))
+    def _atomic_write(self, path: Path, chunks: Iterable[str], backup: bool) -> None:
+        """
+        Atomically replace path with the streamed chunks.
 
-        content = "\n".join(content_parts)
-        content = content.rstrip() + "\n"
+        The content is written to a temp file first, then renamed over path.
 
-        # Create backup if file exists
-        if backup and path.exists():
-            backup_path = path.with_suffix(path.suffix + ".bak")
-            try:
-                shutil.copy2(path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            except OSError as e:
-                raise OrgBackupError(str(path), str(e)) from e
+        Args:
+            path: Output file path
+            chunks: Text chunks making up the new file content
+            backup: If True, back up the existing file before replacing it
 
-        # Write atomically
+        Raises:
+            OrgWriteError: If write fails
+            OrgBackupError: If backup fails
+        """
         temp_path = path.with_suffix(path.suffix + ".tmp")
 
         try:
+            # Ensure parent directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
-            temp_path.write_text(content, encoding="utf-8")
+
+            # Write to temp file
+            _write_chunks(temp_path, chunks)
+
+            # Create backup if file exists
+            if backup:
+                backup_path = path.with_suffix(path.suffix + ".bak")
+                try:
+                    _backup_file(path, backup_path)
+                    logger.info(f"Created backup: {backup_path}")
+                except FileNotFoundError:
+                    pass  # Nothing to back up yet
+                except OSError as e:
+                    raise OrgBackupError(str(path), str(e)) from e
+
+            # Rename to final location
             temp_path.replace(path)
-            logger.info(f"Wrote {len(issues)} issues to {path}")
+
         except OSError as e:
-            if temp_path.exists():
-                temp_path.unlink()
+            # Clean up temp file if it exists
+            temp_path.unlink(missing_ok=True)
             raise OrgWriteError(str(path), str(e)) from e
+        except BaseException:
+            # Formatting failed part-way through the stream, or backup failed
+            temp_path.unlink(missing_ok=True)
+            raise
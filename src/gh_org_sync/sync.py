@@ -9,13 +9,14 @@ This module coordinates the sync process:
 """
 
 import asyncio
+import contextlib
 import logging
 from pathlib import Path
 
 from .exceptions import InvalidRepositoryError
 from .github_client import GitHubClient
 from .merger import OrgMerger
-from .models import MergeResult, SyncConfig
+from .models import MergeResult, OrgHeading, SyncConfig
 from .org_parser import OrgParser
 from .org_writer import OrgWriter
 from .provider import IssueProvider
@@ -105,25 +106,39 @@ class IssueSync:
         logger.info(f"Starting sync: {repo} -> {output_path}")
         logger.info(f"Options: state={state_filter}, limit={limit}, comments={include_comments}")
 
+        # Start parsing the existing Org file in a worker thread, so it
+        # overlaps with fetching issues from the provider
+        parse_task: asyncio.Task[list[OrgHeading]] | None = None
+        if output_path.exists():
+            logger.info(f"Parsing existing file: {output_path}")
+            parse_task = asyncio.create_task(asyncio.to_thread(self.parser.parse_file, output_path))
+        else:
+            logger.info("No existing file, will create new")
+
         # Fetch issues from provider
         provider_name = self.provider.provider_type.value.title()
         logger.info(f"Fetching issues from {provider_name}...")
-        issues = await self.provider.fetch_issues(
-            repo=repo,
-            state=state_filter,
-            limit=limit,
-            include_comments=include_comments,
-        )
+        try:
+            issues = await self.provider.fetch_issues(
+                repo=repo,
+                state=state_filter,
+                limit=limit,
+                include_comments=include_comments,
+            )
+        except BaseException:
+            if parse_task:
+                # A running worker thread cannot be cancelled; wait for it and
+                # retrieve any parse error so the fetch error is what surfaces
+                with contextlib.suppress(Exception):
+                    await parse_task
+            raise
         logger.info(f"Fetched {len(issues)} issues from {provider_name}")
 
-        # Parse existing Org file
-        existing_headings = []
-        if output_path.exists():
-            logger.info(f"Parsing existing file: {output_path}")
-            existing_headings = self.parser.parse_file(output_path)
+        # Wait for the existing Org file
+        existing_headings: list[OrgHeading] = []
+        if parse_task:
+            existing_headings = await parse_task
             logger.info(f"Found {len(existing_headings)} existing headings")
-        else:
-            logger.info("No existing file, will create new")
 
         # Merge
         logger.info("Merging changes...")
@@ -1,4 +1,10 @@
-"""Pytest configuration and fixtures."""
+"""
+Pytest configuration and fixtures.
+
+The sample_* fixtures are session-scoped and shared by every test that uses
+them; copy one (e.g. model_copy(deep=True) or dataclasses.replace) before
+mutating it.
+"""
 
 from datetime import datetime
 
@@ -14,15 +20,58 @@ from gh_org_sync.models import (
     OrgTodoState,
     User,
 )
+from gh_org_sync.org_parser import OrgParser
+
+# Timestamps shared by several fixtures
+_COMMENT_TIME = datetime(2024, 1, 15, 10, 30)
+_CLOSED_TIME = datetime(2024, 1, 12, 16, 0)
+
+_SAMPLE_ORG_CONTENT = """#+TITLE: GitHub Issues
+#+DESCRIPTION: Test issues
+#+STARTUP: overview
+
+* TODO First Issue :LINK:bug:
+:PROPERTIES:
+:GITHUB_NUMBER: 1
+:URL: https://github.com/owner/repo/issues/1
+:GITHUB_STATE: open
+:GITHUB_UPDATED: 2024-01-15T10:00:00
+:END:
+
+This is the first issue body.
+
+** Comment by @user1 [2024-01-15 Mon 10:30]
+First comment.
 
+# --- End of GitHub synced content ---
 
-@pytest.fixture
+User added notes here.
+
+* DONE Second Issue :LINK:
+:PROPERTIES:
+:GITHUB_NUMBER: 2
+:URL: https://github.com/owner/repo/issues/2
+:GITHUB_STATE: closed
+:GITHUB_UPDATED: 2024-01-14T16:00:00
+:END:
+CLOSED: [2024-01-14 Sun 16:00]
+
+This issue was completed.
+
+# --- End of GitHub synced content ---
+
+* TODO User Task
+User created this task manually.
+"""
+
+
+@pytest.fixture(scope="session")
 def sample_user() -> User:
     """Create a sample GitHub user."""
     return User(login="testuser", url="https://github.com/testuser")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_labels() -> list[Label]:
     """Create sample labels."""
     return [
@@ -31,7 +80,7 @@ def sample_labels() -> list[Label]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_milestone() -> Milestone:
     """Create a sample milestone."""
     return Milestone(
@@ -42,19 +91,19 @@ def sample_milestone() -> Milestone:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_comment(sample_user: User) -> Comment:
     """Create a sample comment."""
     return Comment(
         id=1,
         author=sample_user,
         body="This is a test comment.",
-        created_at=datetime(2024, 1, 15, 10, 30),
-        updated_at=datetime(2024, 1, 15, 10, 30),
+        created_at=_COMMENT_TIME,
+        updated_at=_COMMENT_TIME,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issue(
     sample_user: User,
     sample_labels: list[Label],
@@ -78,7 +127,7 @@ def sample_issue(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_closed_issue(sample_user: User) -> GitHubIssue:
     """Create a sample closed issue."""
     return GitHubIssue(
@@ -87,14 +136,14 @@ def sample_closed_issue(sample_user: User) -> GitHubIssue:
         body="This issue is closed.",
         state=IssueState.CLOSED,
         created_at=datetime(2024, 1, 5, 9, 0),
-        updated_at=datetime(2024, 1, 12, 16, 0),
-        closed_at=datetime(2024, 1, 12, 16, 0),
+        updated_at=_CLOSED_TIME,
+        closed_at=_CLOSED_TIME,
         author=sample_user,
         url="https://github.com/owner/repo/issues/124",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_org_heading() -> OrgHeading:
     """Create a sample Org heading."""
     return OrgHeading(
@@ -112,43 +161,13 @@ def sample_org_heading() -> OrgHeading:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_org_content() -> str:
     """Sample Org file content for parsing tests."""
-    return """#+TITLE: GitHub Issues
-#+DESCRIPTION: Test issues
-#+STARTUP: overview
+    return _SAMPLE_ORG_CONTENT
 
-* TODO First Issue :LINK:bug:
-:PROPERTIES:
-:GITHUB_NUMBER: 1
-:URL: https://github.com/owner/repo/issues/1
-:GITHUB_STATE: open
-:GITHUB_UPDATED: 2024-01-15T10:00:00
-:END:
-
-This is the first issue body.
-
-** Comment by @user1 [2024-01-15 Mon 10:30]
-First comment.
-
-# --- End of GitHub synced content ---
 
-User added notes here.
-
-* DONE Second Issue :LINK:
-:PROPERTIES:
-:GITHUB_NUMBER: 2
-:URL: https://github.com/owner/repo/issues/2
-:GITHUB_STATE: closed
-:GITHUB_UPDATED: 2024-01-14T16:00:00
-:END:
-CLOSED: [2024-01-14 Sun 16:00]
-
-This issue was completed.
-
-# --- End of GitHub synced content ---
-
-* TODO User Task
-User created this task manually.
-"""
+@pytest.fixture(scope="session")
+def sample_org_headings(sample_org_content: str) -> list[OrgHeading]:
+    """Sample Org file content, parsed once for read-only lookups."""
+    return OrgParser().parse_string(sample_org_content)
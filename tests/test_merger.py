@@ -1,6 +1,7 @@
 """Tests for merge logic."""
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 
@@ -14,14 +15,37 @@ from gh_org_sync.models import (
     User,
 )
 
+# Author and timestamps shared by the issue fixtures and helpers (all immutable)
+_AUTHOR = User(login="author")
+_CREATED = datetime(2024, 1, 10)
+_UPDATED = datetime(2024, 1, 15, 12, 0)
+_JAN_15 = datetime(2024, 1, 15)
+
+
+def _issue(number: int, **overrides: Any) -> GitHubIssue:
+    """Build an open issue from typed test values, skipping validation."""
+    data: dict[str, Any] = {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": IssueState.OPEN,
+        "created_at": _CREATED,
+        "updated_at": _UPDATED,
+        "author": _AUTHOR,
+        "url": f"https://github.com/owner/repo/issues/{number}",
+    }
+    data.update(overrides)
+    return GitHubIssue.model_construct(**data)
+
+
+@pytest.fixture(scope="session")
+def merger() -> OrgMerger:
+    """Shared merger; OrgMerger keeps no per-merge state."""
+    return OrgMerger()
+
 
 class TestOrgMerger:
     """Tests for OrgMerger class."""
 
-    @pytest.fixture
-    def merger(self) -> OrgMerger:
-        return OrgMerger()
-
     @pytest.fixture
     def github_issue(self) -> GitHubIssue:
         return GitHubIssue(
@@ -29,9 +53,9 @@ class TestOrgMerger:
             title="Test Issue",
             body="Issue body content.",
             state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 15, 12, 0),
-            author=User(login="author"),
+            created_at=_CREATED,
+            updated_at=_UPDATED,
+            author=_AUTHOR,
             url="https://github.com/owner/repo/issues/1",
         )
 
@@ -127,10 +151,10 @@ class TestOrgMerger:
             number=1,
             title="Test Issue",
             state=IssueState.CLOSED,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 15),
-            closed_at=datetime(2024, 1, 15),
-            author=User(login="author"),
+            created_at=_CREATED,
+            updated_at=_JAN_15,
+            closed_at=_JAN_15,
+            author=_AUTHOR,
             url="https://github.com/owner/repo/issues/1",
         )
 
@@ -157,9 +181,9 @@ class TestOrgMerger:
             title="Issue with comments",
             body="Body",
             state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 15),
-            author=User(login="author"),
+            created_at=_CREATED,
+            updated_at=_JAN_15,
+            author=_AUTHOR,
             url="https://github.com/owner/repo/issues/1",
             comments=[
                 Comment(
@@ -170,7 +194,7 @@ class TestOrgMerger:
                 ),
                 Comment(
                     id=2,
-                    author=User(login="author"),
+                    author=_AUTHOR,
                     body="Second comment",
                     created_at=datetime(2024, 1, 14),
                 ),
@@ -195,15 +219,7 @@ class TestOrgMerger:
         """Test that merge result statistics are accurate."""
         user_heading = OrgHeading(level=1, title="User Task")
 
-        new_issue = GitHubIssue(
-            number=2,
-            title="New Issue",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 10),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/2",
-        )
+        new_issue = _issue(2, title="New Issue")
 
         headings, result = merger.merge(
             [github_issue, new_issue],
@@ -219,42 +235,10 @@ class TestOrgMerger:
     def test_merge_preserves_custom_ordering(self, merger: OrgMerger) -> None:
         """Test that user's custom ordering of existing headings is preserved."""
         # Create GitHub issues in sorted order: 5, 10, 15
-        issue_5 = GitHubIssue(
-            number=5,
-            title="Issue 5",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 5),
-            updated_at=datetime(2024, 1, 6),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/5",
-        )
-        issue_10 = GitHubIssue(
-            number=10,
-            title="Issue 10",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 11),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/10",
-        )
-        issue_15 = GitHubIssue(
-            number=15,
-            title="Issue 15",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 15),
-            updated_at=datetime(2024, 1, 16),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/15",
-        )
-        issue_20 = GitHubIssue(
-            number=20,
-            title="Issue 20",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 20),
-            updated_at=datetime(2024, 1, 21),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/20",
-        )
+        issue_5 = _issue(5)
+        issue_10 = _issue(10)
+        issue_15 = _issue(15)
+        issue_20 = _issue(20)
 
         # Create existing headings in CUSTOM order: 15, 5, user, 10
         # This simulates user reordering their org file
@@ -325,42 +309,10 @@ class TestOrgMerger:
         )
 
         # GitHub has issues 10 (existing), 25, 15, 5 (all new, unsorted)
-        issue_10 = GitHubIssue(
-            number=10,
-            title="Issue 10 Updated",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 10),
-            updated_at=datetime(2024, 1, 11),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/10",
-        )
-        issue_25 = GitHubIssue(
-            number=25,
-            title="Issue 25",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 25),
-            updated_at=datetime(2024, 1, 26),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/25",
-        )
-        issue_15 = GitHubIssue(
-            number=15,
-            title="Issue 15",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 15),
-            updated_at=datetime(2024, 1, 16),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/15",
-        )
-        issue_5 = GitHubIssue(
-            number=5,
-            title="Issue 5",
-            state=IssueState.OPEN,
-            created_at=datetime(2024, 1, 5),
-            updated_at=datetime(2024, 1, 6),
-            author=User(login="author"),
-            url="https://github.com/owner/repo/issues/5",
-        )
+        issue_10 = _issue(10, title="Issue 10 Updated")
+        issue_25 = _issue(25)
+        issue_15 = _issue(15)
+        issue_5 = _issue(5)
 
         # Merge
         headings, result = merger.merge(
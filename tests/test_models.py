@@ -1,12 +1,19 @@
 """Tests for Pydantic models."""
 
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
 from gh_org_sync.models import (
+    Comment,
     GitHubIssue,
     IssueState,
     Label,
     MergeAction,
     MergeResult,
     OrgHeading,
+    SyncConfig,
     User,
 )
 
@@ -48,6 +55,30 @@ class TestGitHubIssue:
     def test_assignee_logins(self, sample_issue: GitHubIssue) -> None:
         assert sample_issue.assignee_logins == ["testuser"]
 
+    def test_derived_lists_follow_model_copy(self, sample_issue: GitHubIssue) -> None:
+        assert sample_issue.label_names == ["bug", "enhancement"]
+        copy = sample_issue.model_copy(
+            update={"labels": [Label(name="feat")], "assignees": [User(login="other")]}
+        )
+        assert copy.label_names == ["feat"]
+        assert copy.assignee_logins == ["other"]
+
+    def test_comments_sorted_by_creation(self, sample_issue: GitHubIssue) -> None:
+        early = Comment(
+            id=2,
+            author=User(login="early"),
+            body="Earlier",
+            created_at=datetime(2024, 1, 1),
+        )
+        fields = {name: getattr(sample_issue, name) for name in GitHubIssue.model_fields}
+        issue = GitHubIssue(**(fields | {"comments": [*sample_issue.comments, early]}))
+        assert [c.author.login for c in issue.comments] == ["early", "testuser"]
+
+    def test_invalid_url_rejected(self, sample_issue: GitHubIssue) -> None:
+        fields = {name: getattr(sample_issue, name) for name in GitHubIssue.model_fields}
+        with pytest.raises(ValidationError):
+            GitHubIssue(**(fields | {"url": ""}))
+
 
 class TestOrgHeading:
     """Tests for OrgHeading model."""
@@ -72,6 +103,35 @@ class TestOrgHeading:
         heading = OrgHeading(level=1, title="Test")
         assert heading.github_number is None
 
+    def test_github_number_follows_property_changes(self) -> None:
+        heading = OrgHeading(level=1, title="Test", properties={"GITHUB_NUMBER": "1"})
+        assert heading.github_number == 1
+
+        heading.properties["GITHUB_NUMBER"] = "2"
+        assert heading.github_number == 2
+
+        heading.properties = {}
+        assert heading.github_number is None
+
+    def test_github_updated_parses_org_timestamp(self) -> None:
+        heading = OrgHeading(
+            level=1,
+            title="Test",
+            properties={"GITHUB_UPDATED": "[2024-11-01 Fri 16:12]"},
+        )
+        updated = heading.github_updated
+        assert updated is not None
+        assert (updated.year, updated.month, updated.day) == (2024, 11, 1)
+        assert (updated.hour, updated.minute) == (16, 12)
+
+    def test_github_updated_parses_iso_z_suffix(self) -> None:
+        heading = OrgHeading(
+            level=1,
+            title="Test",
+            properties={"GITHUB_UPDATED": "2024-11-01T16:12:00Z"},
+        )
+        assert heading.github_updated == datetime(2024, 11, 1, 16, 12, tzinfo=UTC)
+
     def test_is_github_synced(self) -> None:
         heading = OrgHeading(
             level=1,
@@ -89,6 +149,16 @@ class TestOrgHeading:
         assert heading.has_tag("link") is True  # Case insensitive
         assert heading.has_tag("feature") is False
 
+    def test_has_tag_follows_tag_changes(self) -> None:
+        heading = OrgHeading(level=1, title="Test", tags=["bug"])
+        assert heading.has_tag("feature") is False
+
+        heading.tags.append("Feature")
+        assert heading.has_tag("feature") is True
+
+        heading.tags = []
+        assert heading.has_tag("bug") is False
+
 
 class TestMergeResult:
     """Tests for MergeResult model."""
@@ -105,6 +175,22 @@ class TestMergeResult:
         result.add_entry(3, "Issue 3", MergeAction.UNCHANGED)
         assert result.unchanged == 1
 
+    def test_count_without_entry(self) -> None:
+        result = MergeResult()
+
+        result.count(MergeAction.PRESERVED)
+        assert result.preserved == 1
+        assert result.entries == []
+
+    def test_counts_round_trip(self) -> None:
+        result = MergeResult(added=3)
+        copy = result.model_copy()
+        copy.count(MergeAction.ADDED)
+
+        assert result.added == 3
+        assert copy.added == 4
+        assert MergeResult.model_validate(copy.model_dump()).added == 4
+
     def test_has_changes(self) -> None:
         result = MergeResult()
         assert result.has_changes is False
@@ -122,3 +208,24 @@ class TestMergeResult:
         assert "2 Org headings" in summary
         assert "Added: 1" in summary
         assert "Updated: 1" in summary
+
+
+class TestSyncConfig:
+    """Tests for SyncConfig model."""
+
+    def test_owner_and_repo_name(self) -> None:
+        config = SyncConfig(repo="octocat/hello-world", output_file="issues.org")
+        assert config.owner == "octocat"
+        assert config.repo_name == "hello-world"
+
+    def test_repo_without_owner(self) -> None:
+        config = SyncConfig(repo="hello-world", output_file="issues.org")
+        assert config.owner == "hello-world"
+        assert config.repo_name == "hello-world"
+
+    def test_owner_follows_model_copy(self) -> None:
+        config = SyncConfig(repo="octocat/hello-world", output_file="issues.org")
+        assert config.owner == "octocat"
+        copy = config.model_copy(update={"repo": "other/project"})
+        assert copy.owner == "other"
+        assert copy.repo_name == "project"
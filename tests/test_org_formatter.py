@@ -0,0 +1,480 @@
+"""Tests for org_formatter module."""
+
+from collections.abc import Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from org_formatter import OrgFormatter, format_org_file_header
+
+# Shared inputs, built once at import
+_TIMESTAMP = datetime(2024, 1, 15, 10, 30)
+_LONG_TITLE = "A" * 500
+
+# Every optional format_issue() argument, set to its empty value
+_NONE_KWARGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "created_at": None,
+        "updated_at": None,
+        "closed_at": None,
+        "author": "",
+        "assignee": "",
+        "labels": None,
+        "milestone": "",
+        "body": "",
+        "comments": None,
+    }
+)
+
+_MULTIPLE_ISSUES: tuple[Mapping[str, Any], ...] = (
+    MappingProxyType(
+        {
+            "title": "First Issue",
+            "number": 1,
+            "state": "open",
+            "url": "https://github.com/user/repo/issues/1",
+            "labels": ["bug"],
+        }
+    ),
+    MappingProxyType(
+        {
+            "title": "Second Issue",
+            "number": 2,
+            "state": "closed",
+            "url": "https://github.com/user/repo/issues/2",
+            "closed_at": datetime(2024, 1, 15, 10, 0),
+            "labels": ["enhancement"],
+        }
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def formatter() -> OrgFormatter:
+    """Shared formatter; OrgFormatter holds no per-call state."""
+    return OrgFormatter()
+
+
+class TestOrgFormatter:
+    """Test cases for OrgFormatter class."""
+
+    @pytest.mark.parametrize(
+        ("active", "expected"),
+        [
+            (False, "[2024-01-15 Mon 10:30]"),
+            (True, "<2024-01-15 Mon 10:30>"),
+        ],
+        ids=["inactive", "active"],
+    )
+    def test_format_timestamp(self, active: bool, expected: str) -> None:
+        """Test inactive and active timestamp formatting."""
+        assert OrgFormatter.format_timestamp(_TIMESTAMP, active=active) == expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("* This looks like a heading", ", * This looks like a heading"),
+            ("# This looks like a comment", ", # This looks like a comment"),
+            ("#+BEGIN_SRC python", ", #+BEGIN_SRC python"),
+            (":PROPERTIES: should be escaped", ", :PROPERTIES: should be escaped"),
+            ("This has [[literal brackets]] in it", r"This has \[\[literal brackets\]\] in it"),
+            (
+                "Normal line\n* Looks like heading\n# Looks like comment\nAnother normal line",
+                "Normal line\n, * Looks like heading\n, # Looks like comment\nAnother normal line",
+            ),
+            ("  * Indented asterisk", "  , * Indented asterisk"),
+            (
+                "This is normal text with no special chars",
+                "This is normal text with no special chars",
+            ),
+        ],
+        ids=[
+            "asterisk",
+            "hash",
+            "directive",
+            "property",
+            "brackets",
+            "multiline",
+            "with_indent",
+            "normal_text",
+        ],
+    )
+    def test_escape_content(self, text: str, expected: str) -> None:
+        """Test escaping of Org-mode syntax at line starts and in links."""
+        assert OrgFormatter.escape_content(text) == expected
+
+    @pytest.mark.parametrize(
+        ("tags", "include_link", "expected"),
+        [
+            (["bug", "urgent"], True, ":LINK:bug:urgent:"),
+            (["bug", "urgent"], False, ":bug:urgent:"),
+            (["priority: high", "needs review"], False, ":priority_high:needs_review:"),
+            ([], False, ""),
+        ],
+        ids=["basic", "no_link", "with_spaces", "empty"],
+    )
+    def test_format_tags(self, tags: list[str], include_link: bool, expected: str) -> None:
+        """Test tag formatting."""
+        assert OrgFormatter.format_tags(tags, include_link=include_link) == expected
+
+    @pytest.mark.parametrize(
+        ("props", "expected"),
+        [
+            # Target column is 11, so :ID: (4 chars) gets 7 spaces, :URL: (5 chars) gets
+            # 6 spaces. Properties are output in dictionary (insertion) order.
+            (
+                {"URL": "https://example.com", "ID": 123},
+                "  :PROPERTIES:\n  :URL:      https://example.com\n  :ID:       123\n  :END:",
+            ),
+            ({"CLOSED": None}, "  :PROPERTIES:\n  :CLOSED:\n  :END:"),
+        ],
+        ids=["basic", "with_none"],
+    )
+    def test_format_properties(self, props: dict[str, Any], expected: str) -> None:
+        """Test properties formatting with target column alignment."""
+        assert OrgFormatter.format_properties(props) == expected
+
+    def test_format_properties_with_datetime(self) -> None:
+        """Test properties with datetime values."""
+        props = {"CREATED": _TIMESTAMP}
+        result = OrgFormatter.format_properties(props)
+        assert "[2024-01-15 Mon 10:30]" in result
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {
+                    "title": "Test Issue",
+                    "number": 123,
+                    "state": "open",
+                    "url": "https://github.com/user/repo/issues/123",
+                    "labels": ["bug"],
+                },
+                # Alignment uses target column 11: :URL: (5) + 6 spaces,
+                # :ID: (4) + 7 spaces, :STATE: (7) + 4 spaces
+                """\
+* TODO Test Issue :LINK:bug:
+  :PROPERTIES:
+  :URL:      https://github.com/user/repo/issues/123
+  :ID:       123
+  :STATE:    open
+  :CREATED:
+  :UPDATED:
+  :CLOSED:
+  :AUTHOR:
+  :ASSIGNEE:
+  :LABELS:   bug
+  :MILESTONE:
+  :COMMENTS: 0
+  :END:
+""",
+            ),
+            (
+                {
+                    "title": "Closed Issue",
+                    "number": 124,
+                    "state": "closed",
+                    "url": "https://github.com/user/repo/issues/124",
+                    "closed_at": datetime(2024, 1, 15, 18, 30),
+                    "labels": ["enhancement"],
+                },
+                # TODO state is DONE, with a CLOSED timestamp
+                """\
+* DONE Closed Issue :LINK:enhancement:
+  :PROPERTIES:
+  :URL:      https://github.com/user/repo/issues/124
+  :ID:       124
+  :STATE:    closed
+  :CREATED:
+  :UPDATED:
+  :CLOSED:   [2024-01-15 Mon 18:30]
+  :AUTHOR:
+  :ASSIGNEE:
+  :LABELS:   enhancement
+  :MILESTONE:
+  :COMMENTS: 0
+  :END:
+  CLOSED: [2024-01-15 Mon 18:30]
+""",
+            ),
+            (
+                {
+                    "title": "Issue with Body",
+                    "number": 125,
+                    "state": "open",
+                    "url": "https://github.com/user/repo/issues/125",
+                    "body": "This is the issue description.\n\n"
+                    "It has multiple paragraphs.\n\n"
+                    "* It even has special characters",
+                },
+                # Body should be escaped
+                """\
+* TODO Issue with Body :LINK:
+  :PROPERTIES:
+  :URL:      https://github.com/user/repo/issues/125
+  :ID:       125
+  :STATE:    open
+  :CREATED:
+  :UPDATED:
+  :CLOSED:
+  :AUTHOR:
+  :ASSIGNEE:
+  :LABELS:
+  :MILESTONE:
+  :COMMENTS: 0
+  :END:
+
+This is the issue description.
+
+It has multiple paragraphs.
+
+, * It even has special characters
+""",
+            ),
+            (
+                {
+                    "title": "Issue with Comments",
+                    "number": 126,
+                    "state": "open",
+                    "url": "https://github.com/user/repo/issues/126",
+                    "comments": [
+                        {
+                            "author": "user1",
+                            "created_at": datetime(2024, 1, 15, 10, 0),
+                            "body": "First comment",
+                        },
+                        {
+                            "author": "user2",
+                            "created_at": datetime(2024, 1, 15, 11, 0),
+                            "body": "Second comment",
+                        },
+                    ],
+                },
+                # Comments are sub-headings; :COMMENTS: (10 chars) >= 11, so 1 space padding
+                """\
+* TODO Issue with Comments :LINK:
+  :PROPERTIES:
+  :URL:      https://github.com/user/repo/issues/126
+  :ID:       126
+  :STATE:    open
+  :CREATED:
+  :UPDATED:
+  :CLOSED:
+  :AUTHOR:
+  :ASSIGNEE:
+  :LABELS:
+  :MILESTONE:
+  :COMMENTS: 2
+  :END:
+
+** Comment by @user1 [2024-01-15 Mon 10:00]
+First comment
+
+** Comment by @user2 [2024-01-15 Mon 11:00]
+Second comment
+""",
+            ),
+            (
+                {
+                    "title": "Nested Issue",
+                    "number": 127,
+                    "state": "open",
+                    "url": "https://github.com/user/repo/issues/127",
+                    "level": 2,
+                },
+                # Should be level 2 heading
+                """\
+** TODO Nested Issue :LINK:
+  :PROPERTIES:
+  :URL:      https://github.com/user/repo/issues/127
+  :ID:       127
+  :STATE:    open
+  :CREATED:
+  :UPDATED:
+  :CLOSED:
+  :AUTHOR:
+  :ASSIGNEE:
+  :LABELS:
+  :MILESTONE:
+  :COMMENTS: 0
+  :END:
+""",
+            ),
+        ],
+        ids=["basic", "closed", "with_body", "with_comments", "hierarchical_level"],
+    )
+    def test_format_issue(
+        self, formatter: OrgFormatter, kwargs: dict[str, Any], expected: str
+    ) -> None:
+        """Test issue formatting against the complete expected entry."""
+        assert formatter.format_issue(**kwargs) == expected
+
+    def test_format_issue_from_dict(self, formatter: OrgFormatter) -> None:
+        """Test formatting issue from dictionary."""
+        issue = {
+            "title": "Dict Issue",
+            "number": 128,
+            "state": "open",
+            "url": "https://github.com/user/repo/issues/128",
+            "labels": ["bug", "urgent"],
+            "body": "Issue body",
+        }
+
+        result = formatter.format_issue_from_dict(issue)
+
+        assert "* TODO Dict Issue" in result
+        assert ":LINK:bug:urgent:" in result
+        assert "Issue body" in result
+
+    def test_format_org_file_header(self) -> None:
+        """Test file header formatting."""
+        result = format_org_file_header(
+            title="Test Issues",
+            description="Test description",
+            author="Test Author",
+            startup_options=["overview", "hidestars"],
+        )
+
+        assert "#+TITLE: Test Issues" in result
+        assert "#+DESCRIPTION: Test description" in result
+        assert "#+AUTHOR: Test Author" in result
+        assert "#+STARTUP: overview hidestars" in result
+
+
+class TestComplexScenarios:
+    """Test complex real-world scenarios."""
+
+    def test_issue_with_code_blocks(self, formatter: OrgFormatter) -> None:
+        """Test issue containing code blocks."""
+        body = """Here's the problematic code:
+
+```python
+def authenticate(user):
+    * Get token
+    # Check validity
+    return token
+```
+
+The asterisk and hash cause issues."""
+
+        result = formatter.format_issue(
+            title="Code Block Issue",
+            number=200,
+            state="open",
+            url="https://github.com/user/repo/issues/200",
+            body=body,
+        )
+
+        # Code block markers should be preserved
+        assert "```python" in result
+        # But asterisk in code should be escaped
+        assert ", * Get token" in result
+        assert ", # Check validity" in result
+
+    def test_issue_with_org_links(self, formatter: OrgFormatter) -> None:
+        """Test issue containing Org-mode link syntax."""
+        body = "See [[https://example.com][this link]] for details."
+
+        result = formatter.format_issue(
+            title="Link Issue",
+            number=201,
+            state="open",
+            url="https://github.com/user/repo/issues/201",
+            body=body,
+        )
+
+        # Opening and closing bracket pairs should be escaped
+        assert r"\[\[" in result
+        assert r"\]\]" in result
+        # The actual escaped content should be present
+        assert "https://example.com" in result
+
+    def test_issue_with_properties_like_text(self, formatter: OrgFormatter) -> None:
+        """Test issue containing text that looks like properties."""
+        body = """:PROPERTIES: drawer in the text
+:KEY: value
+:END:"""
+
+        result = formatter.format_issue(
+            title="Properties Issue",
+            number=202,
+            state="open",
+            url="https://github.com/user/repo/issues/202",
+            body=body,
+        )
+
+        # Property-like text should be escaped
+        assert ", :PROPERTIES: drawer in the text" in result
+        assert ", :KEY: value" in result
+        assert ", :END:" in result
+
+    def test_multiple_issues_in_file(self, formatter: OrgFormatter) -> None:
+        """Test generating multiple issues for a file."""
+        header = format_org_file_header("Multiple Issues", "Test Repository")
+        output = header + "\n" + formatter.format_issues(dict(issue) for issue in _MULTIPLE_ISSUES)
+
+        # Check both issues are present
+        assert "* TODO First Issue" in output
+        assert "* DONE Second Issue" in output
+        assert "#+TITLE: Multiple Issues" in output
+
+
+class TestEdgeCases:
+    """Test edge cases and error conditions."""
+
+    def test_empty_title(self, formatter: OrgFormatter) -> None:
+        """Test issue with empty title."""
+        result = formatter.format_issue(
+            title="",
+            number=300,
+            state="open",
+            url="https://github.com/user/repo/issues/300",
+        )
+
+        # Should handle gracefully
+        assert "* TODO " in result
+
+    def test_none_values(self, formatter: OrgFormatter) -> None:
+        """Test issue with None values."""
+        result = formatter.format_issue(
+            title="None Values",
+            number=301,
+            state="open",
+            url="https://github.com/user/repo/issues/301",
+            **_NONE_KWARGS,
+        )
+
+        # Should handle gracefully without errors
+        assert "* TODO None Values" in result
+        assert ":PROPERTIES:" in result
+
+    def test_very_long_title(self, formatter: OrgFormatter) -> None:
+        """Test issue with very long title."""
+        result = formatter.format_issue(
+            title=_LONG_TITLE,
+            number=302,
+            state="open",
+            url="https://github.com/user/repo/issues/302",
+        )
+
+        # Should include full title, untruncated, in the headline
+        assert result.partition("\n")[0] == f"* TODO {_LONG_TITLE} :LINK:"
+
+    def test_unicode_content(self, formatter: OrgFormatter) -> None:
+        """Test issue with Unicode characters."""
+        result = formatter.format_issue(
+            title="Unicode Test 测试 🚀",
+            number=303,
+            state="open",
+            url="https://github.com/user/repo/issues/303",
+            body="Content with emoji 😀 and Chinese 你好",
+            author="用户",
+        )
+
+        # Unicode should be preserved
+        assert result.partition("\n")[0] == "* TODO Unicode Test 测试 🚀 :LINK:"
+        assert "\n  :AUTHOR:   用户\n" in result
+        assert result.endswith("\nContent with emoji 😀 and Chinese 你好\n")
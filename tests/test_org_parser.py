@@ -1,9 +1,10 @@
 """Tests for Org-mode parser."""
 
-import tempfile
 from pathlib import Path
 
-from gh_org_sync.models import OrgTodoState
+import pytest
+
+from gh_org_sync.models import OrgHeading, OrgTodoState
 from gh_org_sync.org_parser import (
     OrgParser,
     collect_all_headings,
@@ -12,52 +13,51 @@ from gh_org_sync.org_parser import (
 )
 
 
+@pytest.fixture(scope="session")
+def parser() -> OrgParser:
+    """Shared parser; OrgParser keeps no per-parse state."""
+    return OrgParser()
+
+
 class TestOrgParser:
     """Tests for OrgParser class."""
 
-    def test_parse_empty_file(self) -> None:
-        parser = OrgParser()
+    def test_parse_empty_file(self, parser: OrgParser) -> None:
         headings = parser.parse_string("")
         assert headings == []
 
-    def test_parse_simple_heading(self) -> None:
-        parser = OrgParser()
-        content = "* Test Heading"
+    @pytest.mark.parametrize(
+        ("content", "todo_state", "title", "tags"),
+        [
+            ("* Test Heading", None, "Test Heading", []),
+            ("* TODO Task to do", OrgTodoState.TODO, "Task to do", []),
+            ("* DONE Completed task", OrgTodoState.DONE, "Completed task", []),
+            (
+                "* TODO Issue Title :LINK:bug:urgent:",
+                OrgTodoState.TODO,
+                "Issue Title",
+                ["LINK", "bug", "urgent"],
+            ),
+        ],
+        ids=["simple", "todo", "done", "tags"],
+    )
+    def test_parse_heading_line(
+        self,
+        parser: OrgParser,
+        content: str,
+        todo_state: OrgTodoState | None,
+        title: str,
+        tags: list[str],
+    ) -> None:
         headings = parser.parse_string(content)
 
         assert len(headings) == 1
         assert headings[0].level == 1
-        assert headings[0].title == "Test Heading"
+        assert headings[0].todo_state == todo_state
+        assert headings[0].title == title
+        assert headings[0].tags == tags
 
-    def test_parse_todo_heading(self) -> None:
-        parser = OrgParser()
-        content = "* TODO Task to do"
-        headings = parser.parse_string(content)
-
-        assert len(headings) == 1
-        assert headings[0].todo_state == OrgTodoState.TODO
-        assert headings[0].title == "Task to do"
-
-    def test_parse_done_heading(self) -> None:
-        parser = OrgParser()
-        content = "* DONE Completed task"
-        headings = parser.parse_string(content)
-
-        assert len(headings) == 1
-        assert headings[0].todo_state == OrgTodoState.DONE
-        assert headings[0].title == "Completed task"
-
-    def test_parse_heading_with_tags(self) -> None:
-        parser = OrgParser()
-        content = "* TODO Issue Title :LINK:bug:urgent:"
-        headings = parser.parse_string(content)
-
-        assert len(headings) == 1
-        assert headings[0].tags == ["LINK", "bug", "urgent"]
-        assert headings[0].title == "Issue Title"
-
-    def test_parse_properties_drawer(self) -> None:
-        parser = OrgParser()
+    def test_parse_properties_drawer(self, parser: OrgParser) -> None:
         content = """* TODO Test
 :PROPERTIES:
 :URL: https://example.com
@@ -70,8 +70,18 @@ class TestOrgParser:
         assert headings[0].properties["URL"] == "https://example.com"
         assert headings[0].properties["ID"] == "123"
 
-    def test_parse_content(self) -> None:
-        parser = OrgParser()
+    def test_parse_unterminated_drawer_stops_at_next_heading(self, parser: OrgParser) -> None:
+        content = """* First
+:PROPERTIES:
+:ID: 1
+* Second
+"""
+        headings = parser.parse_string(content)
+
+        assert [h.title for h in headings] == ["First", "Second"]
+        assert headings[0].properties == {"ID": "1"}
+
+    def test_parse_content(self, parser: OrgParser) -> None:
         content = """* TODO Test
 
 This is the content.
@@ -83,8 +93,7 @@ With multiple lines.
         assert "This is the content" in headings[0].content
         assert "multiple lines" in headings[0].content
 
-    def test_parse_nested_headings(self) -> None:
-        parser = OrgParser()
+    def test_parse_nested_headings(self, parser: OrgParser) -> None:
         content = """* Parent
 ** Child 1
 ** Child 2
@@ -100,27 +109,20 @@ With multiple lines.
         assert len(headings[0].children[1].children) == 1
         assert headings[0].children[1].children[0].title == "Grandchild"
 
-    def test_parse_file(self, sample_org_content: str) -> None:
-        parser = OrgParser()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".org", delete=False) as f:
-            f.write(sample_org_content)
-            temp_path = Path(f.name)
+    def test_parse_file(self, parser: OrgParser, sample_org_content: str, tmp_path: Path) -> None:
+        path = tmp_path / "sample.org"
+        path.write_text(sample_org_content, encoding="utf-8")
 
-        try:
-            headings = parser.parse_file(temp_path)
+        headings = parser.parse_file(path)
 
-            assert len(headings) == 3
-            assert headings[0].title == "First Issue"
-            assert headings[0].todo_state == OrgTodoState.TODO
-            assert headings[1].title == "Second Issue"
-            assert headings[1].todo_state == OrgTodoState.DONE
-            assert headings[2].title == "User Task"
-        finally:
-            temp_path.unlink()
+        assert len(headings) == 3
+        assert headings[0].title == "First Issue"
+        assert headings[0].todo_state == OrgTodoState.TODO
+        assert headings[1].title == "Second Issue"
+        assert headings[1].todo_state == OrgTodoState.DONE
+        assert headings[2].title == "User Task"
 
-    def test_parse_nonexistent_file(self) -> None:
-        parser = OrgParser()
+    def test_parse_nonexistent_file(self, parser: OrgParser) -> None:
         headings = parser.parse_file(Path("/nonexistent/file.org"))
         assert headings == []
 
@@ -128,27 +130,20 @@ With multiple lines.
 class TestHelperFunctions:
     """Tests for parser helper functions."""
 
-    def test_find_heading_by_property(self, sample_org_content: str) -> None:
-        parser = OrgParser()
-        headings = parser.parse_string(sample_org_content)
-
-        found = find_heading_by_property(headings, "GITHUB_NUMBER", "1")
+    def test_find_heading_by_property(self, sample_org_headings: list[OrgHeading]) -> None:
+        found = find_heading_by_property(sample_org_headings, "GITHUB_NUMBER", "1")
         assert found is not None
         assert found.title == "First Issue"
 
-        not_found = find_heading_by_property(headings, "GITHUB_NUMBER", "999")
+        not_found = find_heading_by_property(sample_org_headings, "GITHUB_NUMBER", "999")
         assert not_found is None
 
-    def test_find_heading_by_github_number(self, sample_org_content: str) -> None:
-        parser = OrgParser()
-        headings = parser.parse_string(sample_org_content)
-
-        found = find_heading_by_github_number(headings, 2)
+    def test_find_heading_by_github_number(self, sample_org_headings: list[OrgHeading]) -> None:
+        found = find_heading_by_github_number(sample_org_headings, 2)
         assert found is not None
         assert found.title == "Second Issue"
 
-    def test_collect_all_headings(self) -> None:
-        parser = OrgParser()
+    def test_collect_all_headings(self, parser: OrgParser) -> None:
         content = """* Parent
 ** Child 1
 ** Child 2
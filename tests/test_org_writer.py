@@ -0,0 +1,159 @@
+"""Tests for Org-mode writer."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from gh_org_sync.models import GitHubIssue, OrgHeading
+from gh_org_sync.org_writer import (
+    OrgWriter,
+    clean_tag,
+    escape_org_content,
+    format_timestamp,
+    markdown_to_org,
+)
+
+
+class TestMarkdownToOrg:
+    """Tests for markdown_to_org."""
+
+    def test_inline_markup(self) -> None:
+        text = "[docs](https://x.org) `code` **bold** __bold__ a *it* _it_ ~~gone~~"
+        assert markdown_to_org(text) == (
+            "[[https://x.org][docs]] =code= *bold* *bold* a /it/ /it/ +gone+"
+        )
+
+    def test_bold_mid_line_stays_bold(self) -> None:
+        assert markdown_to_org("a **bold** b") == "a *bold* b"
+
+    def test_code_is_verbatim(self) -> None:
+        assert markdown_to_org("x `**a**` y") == "x =**a**= y"
+        assert markdown_to_org("```py\nx = **a**\n```") == ("#+BEGIN_SRC py\nx = **a**\n#+END_SRC")
+
+    def test_link_url_untouched_and_text_converted(self) -> None:
+        assert markdown_to_org("[**x**](http://h/__init__.py)") == ("[[http://h/__init__.py][*x*]]")
+
+    def test_nested_markup(self) -> None:
+        assert markdown_to_org("**a _b_ c**") == "*a /b/ c*"
+
+    def test_blockquotes(self) -> None:
+        text = "> one\n>two\nplain > not\n> three"
+        assert markdown_to_org(text) == (
+            "#+BEGIN_QUOTE\none\ntwo\n#+END_QUOTE\nplain > not\n#+BEGIN_QUOTE\nthree\n#+END_QUOTE"
+        )
+
+
+class TestEscapeOrgContent:
+    """Tests for escape_org_content."""
+
+    def test_empty(self) -> None:
+        assert escape_org_content("") == ""
+
+    def test_escapes_heading_star(self) -> None:
+        assert escape_org_content("* not a heading") == ", * not a heading"
+        assert escape_org_content("*") == ", *"
+
+    def test_keeps_bold_and_list_like_stars(self) -> None:
+        assert escape_org_content("*bold* text") == "*bold* text"
+
+    def test_escapes_comment_hash_but_not_keywords(self) -> None:
+        assert escape_org_content("# comment") == ", # comment"
+        assert escape_org_content("#+TITLE: x") == "#+TITLE: x"
+
+    def test_escapes_property_markers(self) -> None:
+        assert escape_org_content(":END:") == ", :END:"
+        assert escape_org_content(":not a keyword:") == ":not a keyword:"
+
+    def test_preserves_indentation(self) -> None:
+        text = "first\n  # indented\n\tplain"
+        assert escape_org_content(text) == "first\n  , # indented\n\tplain"
+
+
+class TestFormatTimestamp:
+    """Tests for format_timestamp."""
+
+    def test_inactive(self) -> None:
+        assert format_timestamp(datetime(2024, 1, 15, 9, 5)) == "[2024-01-15 Mon 09:05]"
+
+    def test_active(self) -> None:
+        assert format_timestamp(datetime(2024, 11, 3, 16, 12), active=True) == (
+            "<2024-11-03 Sun 16:12>"
+        )
+
+
+class TestCleanTag:
+    """Tests for clean_tag."""
+
+    def test_replaces_invalid_runs(self) -> None:
+        assert clean_tag("good first issue") == "good_first_issue"
+        assert clean_tag("area: parser") == "area_parser"
+
+    def test_strips_edges(self) -> None:
+        assert clean_tag("  :wip:  ") == "wip"
+        assert clean_tag(" : ") == ""
+
+
+class TestOrgWriter:
+    """Tests for OrgWriter file output."""
+
+    def test_format_file_header_uses_given_sync_time(self) -> None:
+        header = OrgWriter().format_file_header(
+            "Issues", "owner/repo", sync_time=datetime(2024, 1, 15, 9, 5, tzinfo=UTC)
+        )
+        assert header == (
+            "#+TITLE: Issues\n"
+            "#+DESCRIPTION: GitHub issues synced from owner/repo\n"
+            "#+STARTUP: overview\n"
+            "#+SYNC_REPO: owner/repo\n"
+            "#+SYNC_TIME: 2024-01-15T09:05:00+00:00\n"
+        )
+
+    def test_write_file_ends_with_single_newline(self, tmp_path: Path) -> None:
+        headings = [
+            OrgHeading(level=1, title="First", content="Body\n\n"),
+            OrgHeading(level=1, title="Second", content="  \n\t"),
+        ]
+        path = tmp_path / "out.org"
+
+        OrgWriter().write_file(headings, path, header="#+TITLE: Test\n")
+
+        assert path.read_text() == "#+TITLE: Test\n\n* First\nBody\n\n\n* Second\n"
+        assert not path.with_suffix(".org.tmp").exists()
+
+    def test_write_file_changed_creates_backup(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.org"
+        writer = OrgWriter()
+
+        writer.write_file([OrgHeading(level=1, title="Old")], path)
+        writer.write_file([OrgHeading(level=1, title="New")], path)
+
+        assert path.read_text() == "* New\n"
+        assert path.with_suffix(".org.bak").read_text() == "* Old\n"
+
+    def test_write_file_replaces_previous_backup(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.org"
+        writer = OrgWriter()
+
+        for title in ("One", "Two", "Three"):
+            writer.write_file([OrgHeading(level=1, title=title)], path)
+
+        assert path.read_text() == "* Three\n"
+        assert path.with_suffix(".org.bak").read_text() == "* Two\n"
+
+    def test_write_issues_orders_by_number(
+        self,
+        tmp_path: Path,
+        sample_issue: GitHubIssue,
+        sample_closed_issue: GitHubIssue,
+    ) -> None:
+        path = tmp_path / "issues.org"
+        when = datetime(2024, 2, 1, tzinfo=UTC)
+
+        OrgWriter().write_issues(
+            [sample_closed_issue, sample_issue], path, "owner/repo", sync_time=when
+        )
+
+        text = path.read_text()
+        assert text.startswith("#+TITLE: GitHub Issues: owner/repo\n")
+        assert "#+SYNC_TIME: 2024-02-01T00:00:00+00:00\n" in text
+        assert text.index("Test Issue Title") < text.index("Closed Issue")
+        assert text.endswith("\n") and not text.endswith("\n\n")